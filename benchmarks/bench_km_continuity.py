@@ -0,0 +1,34 @@
+"""
+Benchmark for the KM-continuity engine.
+
+Usage:
+    python -m benchmarks.bench_km_continuity --rows 1000000 --vehicles 2000
+"""
+
+import argparse
+import time
+
+from benchmarks.generators import make_utilizacao_frame
+from project.processors.km_continuity import coerce_km_columns, find_km_inconsistencies
+
+
+def run(rows: int, vehicles: int, repeat: int) -> None:
+    df = make_utilizacao_frame(rows, vehicles)
+    
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = find_km_inconsistencies(coerce_km_columns(df.copy()))
+        timings.append(time.perf_counter() - start)
+    
+    print(f"rows={rows:,} vehicles={vehicles:,} inconsistencies={len(result):,}")
+    print(f"best={min(timings):.3f}s mean={sum(timings) / len(timings):.3f}s ({rows / min(timings):,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the KM-continuity engine")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--vehicles", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.vehicles, args.repeat)
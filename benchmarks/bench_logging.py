@@ -0,0 +1,70 @@
+"""
+Benchmark for the logging backend: caller-side latency of a log call.
+
+Compares the queue-based logger from app_logs against a logger writing to the
+same JSON file handler synchronously, with several threads logging at once
+(like concurrent Streamlit sessions).
+
+Usage:
+    python -m benchmarks.bench_logging --calls 20000 --threads 8
+"""
+
+import argparse
+import logging
+import statistics
+import tempfile
+import threading
+import time
+
+from project.utils.app_logs import DailyRotatingFileHandler, JsonFormatter, setup_logger
+
+
+def _sync_logger(log_dir: str) -> logging.Logger:
+    logger = logging.getLogger("bench_sync")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    handler = DailyRotatingFileHandler(log_dir, "bench_sync")
+    handler.setFormatter(JsonFormatter())
+    logger.addHandler(handler)
+    return logger
+
+
+def _measure(logger: logging.Logger, calls: int, threads: int) -> list[float]:
+    latencies: list[float] = []
+    lock = threading.Lock()
+    
+    def worker() -> None:
+        local = []
+        for i in range(calls):
+            start = time.perf_counter()
+            logger.info("stage", extra={'fields': {'stage': 'read', 'rows': i}})
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+    
+    pool = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return latencies
+
+
+def run(calls: int, threads: int) -> None:
+    with tempfile.TemporaryDirectory() as log_dir:
+        async_logger = setup_logger("bench_async", log_dir=log_dir, console=False)
+        
+        for name, logger in [("sync file", _sync_logger(log_dir)), ("queue", async_logger)]:
+            latencies = sorted(_measure(logger, calls, threads))
+            p99 = latencies[int(len(latencies) * 0.99)]
+            print(f"{name:>10}: mean={statistics.fmean(latencies) * 1e6:7.1f} µs  p99={p99 * 1e6:7.1f} µs  ({len(latencies):,} calls, {threads} threads)")
+        
+        async_logger.handlers[0].listener.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark log call latency")
+    parser.add_argument("--calls", type=int, default=20_000, help="Log calls per thread")
+    parser.add_argument("--threads", type=int, default=8)
+    args = parser.parse_args()
+    run(args.calls, args.threads)
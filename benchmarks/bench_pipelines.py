@@ -0,0 +1,151 @@
+"""
+Stage benchmarks (parse, transform, export) for the BDV and Utilização pipelines.
+
+Workbooks and CSV exports are generated once by `benchmarks.generators` and
+reused; both formats go through the same reader options as the pages. Each stage
+is timed on its own (best of `--repeat`), then run once more under
+tracemalloc to record its peak memory. Results are compared with the stored
+baseline (`benchmarks/baseline.json`); a stage slower than the tolerance
+makes the run fail.
+
+Usage:
+    python -m benchmarks.bench_pipelines --sizes 10k,100k
+    python -m benchmarks.bench_pipelines --sizes 10k,100k,1m --reports bdv
+    python -m benchmarks.bench_pipelines --sizes 10k --formats csv
+    python -m benchmarks.bench_pipelines --sizes 10k,100k,1m --save-baseline
+"""
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from io import BytesIO
+from pathlib import Path
+from typing import Any, Callable
+
+from benchmarks.generators import SIZES, get_workbook, get_csv
+from project.processors.pipelines import (
+    BDV_READER_KWARGS, UTILIZACAO_READER_KWARGS, run_bdv, bdv_issues, run_utilizacao
+)
+from project.readers.excel_reader import ExcelReader
+from project.readers.reader_factory import ReaderFactory
+from project.utils.export import write_frame
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+FORMATS = {'xlsx': get_workbook, 'csv': get_csv}
+
+DEFAULT_TOLERANCE = 0.25
+
+
+def _parse(kind: str, path: Path):
+    kwargs = BDV_READER_KWARGS if kind == 'bdv' else UTILIZACAO_READER_KWARGS
+    reader = ReaderFactory.create_reader(path.name, default=ExcelReader, file_obj=str(path), **kwargs)
+    reader.read()
+    return reader.df
+
+
+def _transform(kind: str, df):
+    if kind == 'bdv':
+        return bdv_issues(run_bdv(df))
+    return run_utilizacao(df)[1]
+
+
+def _export(df):
+    buffer = BytesIO()
+    write_frame(df, buffer, 'xlsx')
+    return buffer.getbuffer().nbytes
+
+
+def _measure(func: Callable[[], Any], repeat: int, memory: bool) -> tuple[Any, dict[str, float]]:
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append(time.perf_counter() - start)
+    
+    stats = {'seconds': min(timings)}
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            stats['peak_mb'] = tracemalloc.get_traced_memory()[1] / 1024 ** 2
+        finally:
+            tracemalloc.stop()
+    return result, stats
+
+
+def run_report(kind: str, size: str, repeat: int, memory: bool, file_format: str = 'xlsx') -> dict[str, dict[str, float]]:
+    path = FORMATS[file_format](kind, SIZES[size])
+    
+    df, parse_stats = _measure(lambda: _parse(kind, path), repeat, memory)
+    issues, transform_stats = _measure(lambda: _transform(kind, df), repeat, memory)
+    _, export_stats = _measure(lambda: _export(issues), repeat, memory)
+    
+    # xlsx keeps the original stage names so older baselines still compare
+    label = kind if file_format == 'xlsx' else f"{kind}.{file_format}"
+    return {
+        f"{label}/{size}/parse": {**parse_stats, 'rows': len(df)},
+        f"{label}/{size}/transform": {**transform_stats, 'rows': len(issues)},
+        f"{label}/{size}/export": {**export_stats, 'rows': len(issues)},
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Print results next to the baseline and return the regressed stages."""
+    regressions = []
+    print(f"{'stage':<32}{'seconds':>10}{'baseline':>10}{'ratio':>8}{'peak MB':>10}{'baseline':>10}")
+    for name, stats in results.items():
+        base = baseline.get(name, {})
+        ratio = stats['seconds'] / base['seconds'] if base.get('seconds') else None
+        print(
+            f"{name:<32}{stats['seconds']:>10.3f}"
+            f"{base.get('seconds', float('nan')):>10.3f}"
+            f"{(f'{ratio:.2f}x' if ratio else '-'):>8}"
+            f"{stats.get('peak_mb', float('nan')):>10.1f}"
+            f"{base.get('peak_mb', float('nan')):>10.1f}"
+        )
+        if ratio and ratio > 1 + tolerance:
+            regressions.append(name)
+        if base.get('peak_mb') and stats.get('peak_mb', 0) > base['peak_mb'] * (1 + tolerance):
+            regressions.append(f"{name} (memory)")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the reader pipelines stage by stage")
+    parser.add_argument("--sizes", default="10k,100k", help=f"Comma-separated sizes ({', '.join(SIZES)})")
+    parser.add_argument("--reports", default="bdv,utilizacao", help="Comma-separated reports (bdv, utilizacao)")
+    parser.add_argument("--formats", default="xlsx,csv", help=f"Comma-separated input formats ({', '.join(FORMATS)})")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Accepted slowdown (0.25 = 25%%)")
+    parser.add_argument("--save-baseline", action="store_true", help="Store these results as the new baseline")
+    args = parser.parse_args()
+    
+    results = {}
+    for kind in args.reports.split(","):
+        for file_format in args.formats.split(","):
+            for size in args.sizes.split(","):
+                results.update(run_report(kind.strip(), size.strip(), args.repeat, not args.no_memory, file_format.strip()))
+    
+    baseline = json.loads(BASELINE_PATH.read_text(encoding='utf-8')) if BASELINE_PATH.exists() else {}
+    regressions = compare(results, baseline, args.tolerance)
+    
+    if args.save_baseline:
+        baseline.update(results)
+        BASELINE_PATH.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n", encoding='utf-8')
+        print(f"💾 Baseline saved to {BASELINE_PATH}")
+        return 0
+    
+    if regressions:
+        print(f"❌ Regressions over {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print("✅ No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,35 @@
+"""
+Benchmark for the BDV Consolidado ↔ Utilização reconciliation.
+
+Usage:
+    python -m benchmarks.bench_reconciliation --vehicles 500 --days 365
+"""
+
+import argparse
+import time
+
+from benchmarks.generators import make_reconciliation_frames
+from project.processors.reconciliation import reconcile
+
+
+def run(vehicles: int, days: int, repeat: int) -> None:
+    bdv, utilizacao = make_reconciliation_frames(vehicles, days)
+    
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = reconcile(bdv, utilizacao)
+        timings.append(time.perf_counter() - start)
+    
+    print(f"bdv={len(bdv):,} utilizacao={len(utilizacao):,} vehicle-days={len(result):,}")
+    print(result['Status'].value_counts().to_string())
+    print(f"best={min(timings):.3f}s mean={sum(timings) / len(timings):.3f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the BDV ↔ Utilização reconciliation")
+    parser.add_argument("--vehicles", type=int, default=500)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.vehicles, args.days, args.repeat)
@@ -0,0 +1,52 @@
+"""
+Benchmark for the shared result cache: cost of a cache hit.
+
+`st.cache_data` pickles the result when storing it and unpickles a copy on
+every hit; the shared result cache hands out read-only views.
+
+Usage:
+    python -m benchmarks.bench_result_cache --rows 1000000 --hits 20
+"""
+
+import argparse
+import pickle
+import time
+
+from benchmarks.generators import make_bdv_frame
+from project.utils.result_cache import ResultCache
+
+
+def _best(function, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def run(rows: int, hits: int, repeat: int) -> None:
+    df = make_bdv_frame(rows)
+    for column in ('Itinerários', 'Placa', 'Organização'):
+        df[column] = df[column].astype('category')
+    
+    pickled = pickle.dumps(df, protocol=pickle.HIGHEST_PROTOCOL)
+    cache = ResultCache(max_bytes=8 * 1024 ** 3)
+    key = cache.make_key("bench", "bdv", rows)
+    cache.put(key, df)
+    
+    copy_seconds = _best(lambda: [pickle.loads(pickled) for _ in range(hits)], repeat)
+    view_seconds = _best(lambda: [cache.get(key) for _ in range(hits)], repeat)
+    
+    print(f"rows={rows:,} hits={hits} size={cache.stats().bytes / 1024 ** 2:,.1f} MB")
+    print(f"pickle copy: {copy_seconds:.3f}s ({copy_seconds / hits * 1000:.2f} ms/hit)")
+    print(f"shared view: {view_seconds:.3f}s ({view_seconds / hits * 1000:.3f} ms/hit)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark cache hits: pickled copies vs shared views")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--hits", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.rows, args.hits, args.repeat)
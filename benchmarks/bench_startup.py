@@ -0,0 +1,118 @@
+"""
+Startup benchmark: import time of app.py and first paint of the Home page.
+
+Each measurement runs in a fresh interpreter so module caches do not hide
+import costs. Fails (exit code 1) when `import app` exceeds the budget or when
+a heavy dependency is loaded before a reader page is opened.
+
+Usage:
+    python -m benchmarks.bench_startup --runs 5 --budget-ms 500
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Only reader pages and cache helpers may need these
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl', 'pyarrow', 'xlsxwriter']
+
+IMPORT_BUDGET_MS = 500
+
+FIRST_PAINT_SCRIPT = """
+import json, sys, time
+from streamlit.testing.v1 import AppTest
+before = set(sys.modules)
+app = AppTest.from_file('app.py')
+start = time.perf_counter()
+app.run(timeout=60)
+elapsed = time.perf_counter() - start
+loaded = set(sys.modules) - before
+print(json.dumps({
+    'ms': elapsed * 1000,
+    'errors': [str(e.value) for e in app.exception],
+    'heavy': [m for m in %r if m in loaded],
+}))
+""" % HEAVY_MODULES
+
+
+def measure_import(top: int = 10) -> tuple[float, list[tuple[float, str]], list[str]]:
+    """Import app.py in a fresh interpreter with -X importtime.
+    
+    Returns:
+        Tuple (total ms, slowest modules as (self ms, name), heavy modules loaded)
+    """
+    probe = "import sys, app; print(','.join(m for m in %r if m in sys.modules))" % HEAVY_MODULES
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    
+    modules = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        modules.append((int(self_us) / 1000, name.strip()))
+        if name.strip() == "app":
+            total_us = int(cumulative_us)
+    
+    heavy = [m for m in result.stdout.strip().split(",") if m]
+    return total_us / 1000, sorted(modules, reverse=True)[:top], heavy
+
+
+def measure_first_paint() -> dict:
+    """Run the app once with Streamlit's AppTest (Home page) in a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_PAINT_SCRIPT],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(runs: int, budget_ms: float) -> int:
+    import_times = []
+    for _ in range(runs):
+        total_ms, slowest, heavy_on_import = measure_import()
+        import_times.append(total_ms)
+    
+    paint = [measure_first_paint() for _ in range(runs)]
+    
+    median_import = statistics.median(import_times)
+    median_paint = statistics.median(p['ms'] for p in paint)
+    heavy_on_paint = sorted({m for p in paint for m in p['heavy']})
+    errors = sorted({e for p in paint for e in p['errors']})
+    
+    print(f"import app: median={median_import:.0f} ms (budget {budget_ms:.0f} ms) runs={runs}")
+    print("slowest modules (self time):")
+    for self_ms, name in slowest:
+        print(f"  {self_ms:8.1f} ms  {name}")
+    print(f"first paint (Home): median={median_paint:.0f} ms")
+    
+    failed = False
+    if median_import > budget_ms:
+        print(f"❌ import time over budget by {median_import - budget_ms:.0f} ms")
+        failed = True
+    if heavy_on_import or heavy_on_paint:
+        print(f"❌ heavy modules loaded at startup: {', '.join(sorted(set(heavy_on_import) | set(heavy_on_paint)))}")
+        failed = True
+    if errors:
+        print(f"❌ app errors: {'; '.join(errors)}")
+        failed = True
+    
+    if not failed:
+        print("✅ startup within budget")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark app startup")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    args = parser.parse_args()
+    sys.exit(run(args.runs, args.budget_ms))
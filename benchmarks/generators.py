@@ -0,0 +1,254 @@
+"""
+Synthetic BDV Consolidado and Utilização workbooks for benchmarks.
+
+Frames use the real column names and value distributions, and workbooks put
+the header on the same row as the real exports (header=2 for BDV,
+header=3 for Utilização), preceded by title rows. CSV exports start with
+the header, like the CSV files users save from the reports.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from project.processors.pipelines import BDV_EXCEL_HEADER, UTILIZACAO_EXCEL_HEADER
+
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+
+SIZES = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+
+ORGANIZATIONS = [f"Unidade {name}" for name in ("Centro", "Norte", "Sul", "Leste", "Oeste", "Porto", "Aeroporto", "Industrial")]
+ROUTES = [f"Garagem - {place}" for place in ("Centro", "Hospital", "Rodoviária", "Prefeitura", "Escola", "Fórum", "Almoxarifado", "Obra")]
+DRIVERS = [f"Motorista {i:03d}" for i in range(300)]
+
+
+def _plates(rng: np.random.Generator, count: int) -> np.ndarray:
+    letters = rng.integers(0, 26, (count, 4))
+    digits = rng.integers(0, 10, (count, 3))
+    return np.array([
+        f"{chr(65 + l[0])}{chr(65 + l[1])}{chr(65 + l[2])}{d[0]}{chr(65 + l[3])}{d[1]}{d[2]}"
+        for l, d in zip(letters, digits)
+    ])
+
+
+def _hhmmss(seconds: np.ndarray) -> pd.Series:
+    seconds = pd.Series(seconds)
+    return (
+        (seconds // 3600).astype(str).str.zfill(2) + ':'
+        + ((seconds % 3600) // 60).astype(str).str.zfill(2) + ':'
+        + (seconds % 60).astype(str).str.zfill(2)
+    )
+
+
+def make_bdv_frame(rows: int, vehicles: int = 500, seed: int = 42) -> pd.DataFrame:
+    """Build a BDV Consolidado frame: ~40 km/h trips, a few over-speed and negative odometer rows.
+    
+    Args:
+        rows: Number of trips
+        vehicles: Number of distinct plates
+        seed: Random seed
+    
+    Returns:
+        DataFrame with the BDV report columns (plus columns the pages do not use)
+    """
+    rng = np.random.default_rng(seed)
+    plates = _plates(rng, vehicles)
+    
+    departure = rng.integers(5 * 3600, 20 * 3600, rows)
+    duration = rng.gamma(2.0, 1800, rows).astype(np.int64) + 60
+    arrival = (departure + duration) % (24 * 3600)
+    
+    speed = rng.normal(40, 15, rows).clip(5, None)
+    speed[rng.random(rows) < 0.02] *= 3
+    km = (speed * duration / 3600).round(1)
+    km[rng.random(rows) < 0.005] *= -1
+    
+    tempo = _hhmmss(duration)
+    # Some exports drop the leading zero, and a few values are malformed
+    tempo = tempo.where(rng.random(rows) > 0.1, tempo.str.lstrip('0'))
+    tempo = tempo.where(rng.random(rows) > 0.001, '--:--')
+    
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(np.sort(rng.integers(0, 365, rows)), unit='D')
+    
+    return pd.DataFrame({
+        'Data': dates,
+        'Itinerários': rng.choice(ROUTES, rows),
+        'Hora Saída': _hhmmss(departure),
+        'Hora Chegada': _hhmmss(arrival),
+        'Tempo': tempo,
+        'Km Rodado': km,
+        'Placa': rng.choice(plates, rows),
+        'Organização': rng.choice(ORGANIZATIONS, rows),
+        'Motorista': rng.choice(DRIVERS, rows),
+        'Observação': np.where(rng.random(rows) < 0.05, "Abastecimento", None),
+    })
+
+
+def make_utilizacao_frame(rows: int, vehicles: int = 2_000, seed: int = 42) -> pd.DataFrame:
+    """Build a Utilização frame: continuous odometer per vehicle with ~1% jumps.
+    
+    Args:
+        rows: Number of records
+        vehicles: Number of distinct vehicles
+        seed: Random seed
+    
+    Returns:
+        DataFrame with the Utilização report columns (plus columns the pages do not use)
+    """
+    rng = np.random.default_rng(seed)
+    vehicle_ids = rng.integers(0, vehicles, rows)
+    trip_km = rng.integers(0, 300, rows)
+    
+    km_end = pd.Series(trip_km).groupby(vehicle_ids).cumsum().to_numpy() + 10_000
+    km_start = km_end - trip_km
+    jumps = rng.random(rows) < 0.01
+    km_start[jumps] += rng.integers(-50, 500, jumps.sum())
+    
+    dates = pd.Timestamp('2025-01-01') + pd.to_timedelta(np.sort(rng.integers(0, 31 * 24 * 3600, rows)), unit='s')
+    
+    return pd.DataFrame({
+        'Veículo': pd.Series(vehicle_ids).map(lambda v: f"VEH-{v:05d}"),
+        'Data': dates.strftime('%d/%m/%Y %H:%M:%S'),
+        'Km Inicial': km_start,
+        'Km Final': km_end,
+        'Horas': rng.integers(1, 12, rows),
+        'Organização': rng.choice(ORGANIZATIONS, rows),
+        'Motorista': rng.choice(DRIVERS, rows),
+    })
+
+
+def make_reconciliation_frames(vehicles: int = 500, days: int = 365, trips_per_day: int = 4, seed: int = 42) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Build a BDV Consolidado and a Utilização frame of the same fleet and period.
+    
+    Each vehicle-day has a few BDV trips and one or two Utilização records
+    covering the same km. About 2% of the days differ, 1% are missing from
+    each report, and plates are written differently in each ('ABC1D23' vs
+    'abc-1d23').
+    
+    Args:
+        vehicles: Number of vehicles
+        days: Number of days from 2025-01-01
+        trips_per_day: Average BDV trips per vehicle-day
+        seed: Random seed
+    
+    Returns:
+        Tuple (BDV frame, Utilização frame)
+    """
+    rng = np.random.default_rng(seed)
+    plates = _plates(rng, vehicles)
+    
+    vehicle_days = vehicles * days
+    vehicle = np.repeat(np.arange(vehicles), days)
+    day = np.tile(np.arange(days), vehicles)
+    trips = rng.poisson(trips_per_day, vehicle_days) + 1
+    
+    trip_day = np.repeat(np.arange(vehicle_days), trips)
+    trip_km = rng.gamma(2.0, 10, len(trip_day)).round(1)
+    day_km = np.bincount(trip_day, weights=trip_km, minlength=vehicle_days)
+    
+    odometer_km = day_km.copy()
+    mismatch = rng.random(vehicle_days) < 0.02
+    odometer_km[mismatch] += rng.integers(20, 200, mismatch.sum())
+    
+    keep_bdv = np.repeat(rng.random(vehicle_days) > 0.01, trips)
+    keep_util = rng.random(vehicle_days) > 0.01
+    
+    # Continuous odometer per vehicle; some days are split in two records
+    km_end = 10_000 + pd.Series(odometer_km).groupby(vehicle).cumsum().to_numpy()
+    km_start = km_end - odometer_km
+    split = keep_util & (rng.random(vehicle_days) < 0.3)
+    middle = (km_start + km_end) / 2
+    
+    start = pd.Timestamp('2025-01-01')
+    dates = start + pd.to_timedelta(day, unit='D')
+    util_rows = np.concatenate([np.flatnonzero(keep_util), np.flatnonzero(split)])
+    util_start = np.concatenate([km_start[keep_util], middle[split]])
+    util_end = np.concatenate([np.where(split, middle, km_end)[keep_util], km_end[split]])
+    util_time = pd.to_timedelta(np.concatenate([np.full(keep_util.sum(), 8), np.full(split.sum(), 14)]), unit='h')
+    
+    bdv = pd.DataFrame({
+        'Data': dates[trip_day[keep_bdv]],
+        'Km Rodado': trip_km[keep_bdv],
+        'Placa': plates[vehicle[trip_day[keep_bdv]]],
+    })
+    utilizacao = pd.DataFrame({
+        'Veículo': pd.Series(plates).str.lower().str.replace(r'^(\w{3})', r'\1-', regex=True).to_numpy()[vehicle[util_rows]],
+        'Data': (dates[util_rows] + util_time).strftime('%d/%m/%Y %H:%M:%S'),
+        'Km Inicial': util_start.round(1),
+        'Km Final': util_end.round(1),
+    }).sort_values('Data', kind='stable', ignore_index=True)
+    return bdv, utilizacao
+
+
+def write_workbook(df: pd.DataFrame, path: str | Path, header: int, title: str) -> Path:
+    """Write a frame as an xlsx report whose header is on row `header` (0-based).
+    
+    Rows are streamed with xlsxwriter constant_memory mode, so 1M-row
+    workbooks can be generated without holding the sheet in memory.
+    """
+    import xlsxwriter
+    
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    workbook = xlsxwriter.Workbook(str(path), {'constant_memory': True, 'default_date_format': 'dd/mm/yyyy'})
+    try:
+        worksheet = workbook.add_worksheet("Relatório")
+        worksheet.write(0, 0, title)
+        worksheet.write_row(header, 0, list(df.columns))
+        values = df.astype(object).where(df.notna(), None)
+        for row_number, row in enumerate(values.itertuples(index=False, name=None), start=header + 1):
+            worksheet.write_row(row_number, 0, row)
+    finally:
+        workbook.close()
+    return path
+
+
+def get_workbook(kind: str, rows: int, seed: int = 42) -> Path:
+    """Return the path of a generated workbook, generating it on first use.
+    
+    Args:
+        kind: 'bdv' or 'utilizacao'
+        rows: Number of data rows
+        seed: Random seed
+    
+    Returns:
+        Path to the cached workbook in benchmarks/.data
+    """
+    path = DATA_DIR / f"{kind}_{rows}_{seed}.xlsx"
+    if path.exists():
+        return path
+    
+    if kind == 'bdv':
+        return write_workbook(make_bdv_frame(rows, seed=seed), path, BDV_EXCEL_HEADER, "BDV Consolidado")
+    if kind == 'utilizacao':
+        return write_workbook(make_utilizacao_frame(rows, seed=seed), path, UTILIZACAO_EXCEL_HEADER, "Relatório de Utilização")
+    raise ValueError(f"Unknown report kind: {kind}")
+
+
+def get_csv(kind: str, rows: int, seed: int = 42) -> Path:
+    """Return the path of a generated CSV export (header on the first row), generating it on first use.
+    
+    Args:
+        kind: 'bdv' or 'utilizacao'
+        rows: Number of data rows
+        seed: Random seed
+    
+    Returns:
+        Path to the cached CSV file in benchmarks/.data
+    """
+    path = DATA_DIR / f"{kind}_{rows}_{seed}.csv"
+    if path.exists():
+        return path
+    
+    if kind == 'bdv':
+        df = make_bdv_frame(rows, seed=seed)
+    elif kind == 'utilizacao':
+        df = make_utilizacao_frame(rows, seed=seed)
+    else:
+        raise ValueError(f"Unknown report kind: {kind}")
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_csv(path, sep=';', index=False, date_format='%d/%m/%Y')
+    return path
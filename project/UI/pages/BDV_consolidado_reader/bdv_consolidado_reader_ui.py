@@ -1,7 +1,11 @@
-from io import BytesIO
 import streamlit as st
 from project.UI.pages.page_base_reader import PageBaseReader
-from project.readers.excel_reader import ExcelReader
+from project.readers.base_reader import BaseReader
+from project.readers.batch import SOURCE_FILE_COLUMN
+from project.utils.streamlit.download_utils import render_download_buttons
+from project.utils.streamlit.grid_utils import render_paginated_grid
+from project.processors.bdv_consolidado import DEFAULT_SPEED_THRESHOLD, RULE_HITS_ATTR
+from project.processors.pipelines import BDV_READER_KWARGS, transform_bdv, apply_bdv_status, bdv_issues
 from typing import Optional, Any
 import pandas as pd
 
@@ -12,7 +16,8 @@ class BDVConsolidadoReaderUI(PageBaseReader):
             icon="📒",
             description="Page for BDV Consolidado reports analysis."
         )
-        self.reader: Optional[ExcelReader] = None
+        self.reader: Optional[BaseReader] = None
+        self.df_issues: Optional[pd.DataFrame] = None
         
     def render(self) -> None:
         st.title(f"{self._icon} {self.page_name}")
@@ -23,46 +28,13 @@ class BDVConsolidadoReaderUI(PageBaseReader):
             
         st.number_input("Average Speed Threshold (km/h):", min_value=80, max_value=200, value=100, key='avg_speed_threshold', help="Set the speed threshold to flag over-speeding incidents.")
         
-        uploaded_file = st.file_uploader(
-            "📁 Upload your file",
-            type=self.get_file_types(),
-            help=f"Accepted formats: {', '.join(self.get_file_types())}",
-            key="bdv_consolidado_file_uploader"
-        )
-        
-        if uploaded_file:
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                st.info(f"📄 **File:** {uploaded_file.name}")
-            with col2:
-                st.info(f"**Size:** {uploaded_file.size / 1024:.1f} KB")
-            
-            self._process_file(uploaded_file)
+        self._render_uploader("bdv_consolidado_file_uploader")
     
-    def _process_file(self, uploaded_file: Any) -> None:
-        """Process the uploaded BDV Consolidado file.
-        
-        Args:
-            uploaded_file: Streamlit UploadedFile object
-        """
-        with st.spinner("⏳ Processing BDV Consolidado file..."):
-            try:
-                self.reader = ExcelReader(file_obj=uploaded_file, header=2, dtype={'Km Rodado': 'float', 'Hora Saída': str, 'Hora Chegada': str, 'Tempo': str})
-                self.reader.safe_read()
-                
-                if self.reader.df is not None:
-                    st.success(f"✅ {self.reader.file_obj.name} file read successfully!")
-                    try:
-                        self.process_data()
-                    except Exception as e:
-                        st.error(f"❌ Processing error: {e}")
-                        return
-                    
-                    self.display_results()
-                else:
-                    st.error("❌ Error reading file. Please check the format and try again.")
-            except Exception as e:
-                st.error(f"❌ Unexpected error: {e}")
+    def get_reader_kwargs(self) -> dict[str, Any]:
+        return BDV_READER_KWARGS
+    
+    def get_processing_message(self) -> str:
+        return "⏳ Processing BDV Consolidado file..."
     
     def process_data(self) -> None:
         """Process data specific to BDV Consolidado reports."""
@@ -70,35 +42,17 @@ class BDVConsolidadoReaderUI(PageBaseReader):
             st.error("❌ No data loaded. Please upload a file first.")
             return
         
-        df = self.reader.df.copy()
-        
-        columns_to_normalize = ['Hora Saída', 'Hora Chegada', 'Tempo']
-        
-        for col in columns_to_normalize:
-            if col in df.columns:
-                df[col] = df[col].astype(str).str.zfill(8)        
+        df = self._memoize('transform', self.file_hash, lambda: transform_bdv(self.reader.df))
         
-        df['Velocidade média'] = df.apply(lambda row: ((row['Km Rodado'] * 1000) / self._time_to_seconds(row['Tempo']) * 3.6) if self._time_to_seconds(row['Tempo']) > 0 else 0, axis=1)
-        
-        threshold = st.session_state.get('avg_speed_threshold', 100)
-        df['Status'] = df.apply(lambda row: 'Negative odometer' if row['Km Rodado'] < 0 else ('Over speed' if row['Velocidade média'] > threshold else 'OK'), axis=1)
-        
-        self.reader.df = df
+        # Only the status depends on the threshold, so changing it does not recompute the speed
+        threshold = st.session_state.get('avg_speed_threshold', DEFAULT_SPEED_THRESHOLD)
+        self.reader.df = self._memoize('status', (self.file_hash, threshold), lambda: apply_bdv_status(df, threshold))
+        self.df_issues = self._memoize('issues', (self.file_hash, threshold), self._build_issues)
     
-    def _time_to_seconds(self, time_str: str) -> int:
-        """Convert time string in HH:MM:SS format to total seconds.
-        
-        Args:
-            time_str: Time string in HH:MM:SS format.
-        
-        Returns:
-            Total seconds as integer.
-        """
-        try:
-            h, m, s = map(int, time_str.split(':'))
-            return h * 3600 + m * 60 + s
-        except:
-            return 0
+    def _build_issues(self) -> pd.DataFrame:
+        df_issues = bdv_issues(self.reader.df, extra_columns=[SOURCE_FILE_COLUMN]).reset_index(drop=True)
+        df_issues['Velocidade média'] = df_issues['Velocidade média'].round(2)
+        return df_issues
         
     def display_results(self) -> None:
         """Display results specific to BDV Consolidado reports."""
@@ -106,27 +60,26 @@ class BDVConsolidadoReaderUI(PageBaseReader):
             st.error("❌ No data to display. Please upload and process a file first.")
             return
         
-        columns_to_show = ['Data', 'Itinerários', 'Hora Saída', 'Hora Chegada', 'Tempo', 'Km Rodado', 'Placa', 'Organização', 'Velocidade média', 'Status']
-        
-        if self.reader.df['Status'].isin(['Over speed', 'Negative odometer']).any():
-            st.warning("⚠️ It seems there are records with issues:")
-            df_issues = self.reader.df[self.reader.df['Status'].isin(['Over speed', 'Negative odometer'])][columns_to_show].copy()
+        if self.df_issues is not None and not self.df_issues.empty:
+            st.warning(f"⚠️ It seems there are {len(self.df_issues):,} records with issues:")
             
-            df_display = df_issues.copy()
-            df_display['Velocidade média'] = df_display['Velocidade média'].round(2).astype(str) + " km/h"
-            st.dataframe(df_display.reset_index(drop=True), width='stretch', hide_index=True)
+            # Rows matched by each rule (a row can match several; its status is the most severe)
+            hits = self.reader.df.attrs.get(RULE_HITS_ATTR, {})
+            if hits:
+                st.caption(" · ".join(f"{label}: {count:,}" for label, count in hits.items()))
             
-            df_issues['Velocidade média'] = df_issues['Velocidade média'].round(2)
-            buffer = BytesIO()
-            with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                df_display.to_excel(writer, index=False, sheet_name='Issues')
+            render_paginated_grid(
+                self.df_issues,
+                key="bdv_issues_grid",
+                column_config={'Velocidade média': st.column_config.NumberColumn(format="%.2f km/h")}
+            )
             
-            st.download_button(
+            render_download_buttons(
+                self.df_issues,
                 label="📥 Download Issues Report",
-                data=buffer.getvalue(),
-                file_name="bdv_consolidado_issues_report.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                key="bdv_download_issues"
+                file_stem="bdv_consolidado_issues_report",
+                key="bdv_download_issues",
+                sheet_name='Issues'
             )
         else:
             st.success("✅ All records are OK.")
@@ -4,9 +4,6 @@ from project.UI.pages.base_page import BasePage
 
 class HomePage(BasePage):
     
-    def __init__(self):
-        self.tools = ToolRegister.get_tools()
-        
     def get_name(self):
         return 'Home'
     
@@ -21,17 +18,19 @@ class HomePage(BasePage):
             
     def _tabs(self):
         
-        if not self.tools:
+        tool_entries = ToolRegister.get_entries()
+        if not tool_entries:
             st.info("No tools available.")
             return
         
-        tab_labels = [f"{tool.get_icon()} {tool.get_name()}" for tool in self.tools]
+        tab_labels = [f"{entry.icon} {entry.name}" for entry in tool_entries]
         tabs = st.tabs(tab_labels)
         
-        for tab, tool in zip(tabs, self.tools):
+        # Tools are imported and built only here, when the Home page is actually shown
+        for tab, entry in zip(tabs, tool_entries):
             with tab:
                 try:
-                    tool.render()
+                    ToolRegister.create_tool(entry.name).render()
                 except Exception as e:
-                    st.error(f"Error loading tool '{tool.get_name()}': {e}")
+                    st.error(f"Error loading tool '{entry.name}': {e}")
                 
\ No newline at end of file
@@ -1,6 +1,18 @@
 import streamlit as st
+from typing import Any, Callable
 from project.UI.pages.base_page import BasePage
+from project.readers.base_reader import BaseReader
 from project.readers.excel_reader import ExcelReader
+from project.readers.reader_factory import ReaderFactory
+from project.readers.parsed_cache import get_default_cache
+from project.readers.batch import read_files_parallel, combine_results
+from project.utils.hashing import get_file_hash, get_source_hash
+from project.utils import app_logs
+from project.utils.perf import StageTimer, count_rows
+from project.utils.lineage import Lineage, tag_lineage
+from project.utils.result_cache import get_result_cache
+from project.utils.streamlit.cache_data_utils import compute_dataframe_stats
+from project.utils.streamlit.grid_utils import render_paginated_grid
 
 
 class PageBaseReader(BasePage):    
@@ -8,6 +20,8 @@ class PageBaseReader(BasePage):
         self.page_name = page_name
         self.reader_class = reader_class
         self.reader = None
+        self.file_hash: str | None = None
+        self.timer = StageTimer(page=page_name)
         self._icon = icon
         self._description = description
     
@@ -28,6 +42,37 @@ class PageBaseReader(BasePage):
             st.divider()
         
         file_uploader_key = f"{self.page_name.lower().replace(' ', '_')}_file_uploader"
+        self._render_uploader(file_uploader_key)
+    
+    def _render_uploader(self, file_uploader_key: str) -> None:
+        """Render the single-file uploader, or the multi-file uploader in batch mode."""
+        app_logs.set_page_context(self.page_name)
+        batch_key = file_uploader_key.removesuffix('_file_uploader')
+        batch_mode = st.toggle(
+            "📚 Batch mode",
+            key=f"{batch_key}_batch_mode",
+            help="Upload several files at once. They are parsed in parallel and analysed together."
+        )
+        
+        if batch_mode:
+            uploaded_files = st.file_uploader(
+                "📁 Upload your files",
+                type=self.get_file_types(),
+                accept_multiple_files=True,
+                help=f"Accepted formats: {', '.join(self.get_file_types())}",
+                key=f"{batch_key}_batch_file_uploader"
+            )
+            
+            if uploaded_files:
+                col1, col2 = st.columns([3, 1])
+                with col1:
+                    st.info(f"📄 **Files:** {len(uploaded_files)}")
+                with col2:
+                    st.info(f"**Size:** {sum(f.size for f in uploaded_files) / 1024:.1f} KB")
+                
+                self._process_batch(uploaded_files)
+            return
+        
         uploaded_file = st.file_uploader(
             "📁 Upload your file",
             type=self.get_file_types(),
@@ -44,35 +89,180 @@ class PageBaseReader(BasePage):
             
             self._process_file(uploaded_file)
     
+    def get_reader_kwargs(self) -> dict[str, Any]:
+        """Return the reader options (schema, dtype, per-format header...) used for this page's files."""
+        return {'compact': True}
+    
+    def _create_reader(self, uploaded_file: Any) -> BaseReader:
+        """Create the reader matching the uploaded file type (Excel, CSV, Parquet, Arrow)."""
+        return ReaderFactory.create_reader(uploaded_file.name, default=self.reader_class, file_obj=uploaded_file, cache=get_default_cache(), **self.get_reader_kwargs())
+    
+    def get_processing_message(self) -> str:
+        return "⏳ Processing file..."
     
     def _process_file(self, uploaded_file):
-        with st.spinner("⏳ Processing file..."):
+        with st.spinner(self.get_processing_message()):
             try:
-                self.reader = self.reader_class(file_obj=uploaded_file)
-                self.reader.safe_read()
+                self.reader = self._create_reader(uploaded_file)
+                self._read_memoized()
                 
                 if self.reader.df is not None:
-                    st.success("✅ File read successfully!")
-                    
-                    try:
-                        self.process_data()
-                    except Exception as e:
-                        st.error(f"❌ Processing error: {e}")
-                        return
-                    
-                    self.display_results()
+                    st.success(f"✅ {uploaded_file.name} file read successfully!")
+                    self._process_and_display()
                 else:
                     st.error("❌ Error reading file. Please check the format and try again.")
             
             except Exception as e:
                 st.error(f"❌ Unexpected error: {e}")
+        
+        self._render_perf_panel()
+    
+    def _process_and_display(self) -> None:
+        """Run `process_data` and `display_results`, timing each of them."""
+        try:
+            with self.timer.span('process_data') as span:
+                self.process_data()
+                span['rows'] = count_rows(self.reader.df)
+        except Exception as e:
+            st.error(f"❌ Processing error: {e}")
+            return
+        
+        with self.timer.span('display_results'):
+            self.display_results()
+    
+    def _process_batch(self, uploaded_files: list) -> None:
+        """Parse several files in a process pool, merge them and process them once.
+        
+        A source-file column identifies where each row came from. Files that
+        fail are reported individually and left out of the analysis.
+        
+        Args:
+            uploaded_files: Streamlit UploadedFile objects
+        """
+        names = [uploaded_file.name for uploaded_file in uploaded_files]
+        # Source hashes are memoized per upload, so a rerun neither reads nor hashes the files
+        self.file_hash = get_file_hash(''.join(get_source_hash(uploaded_file) for uploaded_file in uploaded_files).encode())
+        
+        def read_batch():
+            files = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+            progress = st.progress(0.0, text="⏳ Reading files...")
+            results = []
+            for done, result in enumerate(read_files_parallel(self.reader_class, files, {'cache': get_default_cache(), **self.get_reader_kwargs()}), start=1):
+                results.append(result)
+                progress.progress(done / len(files), text=f"⏳ Read {done}/{len(files)}: {result.name}")
+            progress.empty()
+            return results
+        
+        try:
+            results = self._memoize('read', (self.file_hash, repr(self.get_reader_kwargs())), read_batch, files=len(names), input_bytes=sum(uploaded_file.size for uploaded_file in uploaded_files))
+            
+            for result in results:
+                if result.error:
+                    st.error(f"❌ {result.name}: {result.error}")
+            
+            df = combine_results(results)
+            if df is None:
+                self._get_memo().pop('read', None)
+                st.error("❌ No file could be read. Please check the format and try again.")
+                return
+            
+            read_count = sum(result.df is not None for result in results)
+            st.success(f"✅ {read_count}/{len(names)} files read successfully ({len(df):,} rows)!")
+            
+            self.reader = ReaderFactory.create_reader(names[0], default=self.reader_class, file_obj=None, **self.get_reader_kwargs())
+            self.reader.df = df
+            
+            self._process_and_display()
+        except Exception as e:
+            st.error(f"❌ Unexpected error: {e}")
+        
+        self._render_perf_panel()
+    
+    def _get_memo(self) -> dict[str, tuple[Any, Any]]:
+        return st.session_state.setdefault(f"{self.page_name.lower().replace(' ', '_')}_memo", {})
+    
+    def _memoize(self, stage: str, key: Any, compute: Callable[[], Any], shared: bool = True, **span_fields: Any) -> Any:
+        """Return the result of a pipeline stage, recomputing it only when its key changes.
+        
+        Results live in `st.session_state`, one entry per stage, so a rerun
+        triggered by an unrelated widget reuses them. Shared stages are also
+        looked up in the process-wide result cache, keyed by the file hash and
+        the stage (its lineage), so other sessions working on the same file get
+        a read-only view instead of recomputing it. Stage
+        keys should include `self.file_hash` and every parameter the stage
+        depends on. Without a file hash (headless use) the stage is always computed.
+        
+        Args:
+            stage: Stage name ('read', 'transform', 'status'...)
+            key: Hashable key identifying the stage inputs
+            compute: Function producing the stage result
+            shared: Share the result with other sessions (disable for stages with side effects)
+            **span_fields: Extra fields for the stage timing span (e.g. input_bytes)
+        
+        Returns:
+            Stage result (shared between reruns and sessions, do not mutate it)
+        """
+        with self.timer.span(stage, **span_fields) as span:
+            if self.file_hash is None:
+                value = compute()
+            else:
+                memo = self._get_memo()
+                entry = memo.get(stage)
+                span['cached'] = entry is not None and entry[0] == key
+                if span['cached']:
+                    value = entry[1]
+                else:
+                    # Results are tagged so the cached grid helpers key them by lineage instead of content
+                    lineage = Lineage.from_source(self.file_hash).then(f"{self.page_name}:{stage}", key=key)
+                    if shared:
+                        value, span['cached'] = get_result_cache().get_or_compute(lineage, compute)
+                    else:
+                        value = compute()
+                    memo[stage] = (key, tag_lineage(value, lineage))
+            span['rows'] = count_rows(value)
+        return value
+    
+    def _read_memoized(self) -> None:
+        """Read `self.reader`'s file once per session and file content."""
+        self.file_hash = get_source_hash(self.reader.file_obj)
+        
+        def read():
+            self.reader.safe_read()
+            return self.reader.df
+        
+        df = self._memoize('read', (self.file_hash, repr(self.reader.get_cache_config())), read, input_bytes=getattr(self.reader.file_obj, 'size', None))
+        if df is None:
+            # Failed reads are not memoized so a retry re-reads the file
+            self._get_memo().pop('read', None)
+        self.reader.df = df
+    
+    def _render_perf_panel(self) -> None:
+        """Show the stage timings of this run when the page is opened with `?perf=1`."""
+        if st.query_params.get('perf') != '1' or not self.timer.spans:
+            return
+        
+        with st.expander(f"⏱️ Performance ({self.timer.total_seconds():.2f} s)"):
+            st.dataframe(self.timer.spans, width='stretch', hide_index=True)
+            
+            if self.reader is not None and self.reader.df is not None:
+                stats = compute_dataframe_stats(self.reader.df)
+                st.caption(
+                    f"💾 Memory: {stats['memory_usage'] / 1024 ** 2:,.1f} MB "
+                    f"({stats['memory_saved'] / 1024 ** 2:,.1f} MB saved by compact dtypes)"
+                )
+            
+            cache = get_result_cache().stats()
+            st.caption(
+                f"🗄️ Shared cache: {cache.entries} results, {cache.bytes / 1024 ** 2:,.1f} / {cache.max_bytes / 1024 ** 2:,.0f} MB, "
+                f"{cache.hits:,} hits, {cache.misses:,} misses, {cache.evictions:,} evictions"
+            )
     
     def get_file_types(self):
-        return ["xlsx", "xls"]
+        return ReaderFactory.get_file_types()
     
     def process_data(self):
         pass
     
     def display_results(self):
         st.subheader("📋 Loaded Data")
-        st.dataframe(self.reader.df, width='content', hide_index=True)
\ No newline at end of file
+        render_paginated_grid(self.reader.df, key=f"{self.page_name.lower().replace(' ', '_')}_grid")
\ No newline at end of file
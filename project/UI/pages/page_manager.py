@@ -1,30 +1,73 @@
-
+import importlib
+from typing import NamedTuple
 from project.UI.pages.base_page import BasePage
-from project.UI.pages.home.home_page import HomePage
-from project.UI.pages.about.about_page_ui import AboutPage
-from project.UI.pages.utilizacao_reader.utilizacao_reader import UtilizacaoReader
-from project.UI.pages.BDV_consolidado_reader.bdv_consolidado_reader_ui import BDVConsolidadoReaderUI
+
+
+class PageEntry(NamedTuple):
+    """Page metadata, available without importing the page module."""
+    name: str
+    module: str
+    class_name: str
+    icon: str = "📄"
+    description: str = ""
+
 
 class PageManager:
     
-    _pages: list[type[BasePage]] = [
-        HomePage,
-        UtilizacaoReader,
-        BDVConsolidadoReaderUI,
-        AboutPage
+    _pages: list[PageEntry] = [
+        PageEntry("Home", "project.UI.pages.home.home_page", "HomePage"),
+        PageEntry("Utilização Reader", "project.UI.pages.utilizacao_reader.utilizacao_reader", "UtilizacaoReader", "📚", "Page for Utilização reports analysis."),
+        PageEntry("BDV Consolidado Reader", "project.UI.pages.BDV_consolidado_reader.bdv_consolidado_reader_ui", "BDVConsolidadoReaderUI", "📒", "Page for BDV Consolidado reports analysis."),
+        PageEntry("Reconciliation", "project.UI.pages.reconciliation.reconciliation_page", "ReconciliationPage", "🔗", "Page to compare the km of BDV Consolidado trips with the Utilização odometer, per vehicle and day."),
+        PageEntry("About", "project.UI.pages.about.about_page_ui", "AboutPage", "ℹ️", "Learn more about the Smart Tools application."),
     ]
     
+    _loaded: dict[str, type[BasePage]] = {}
+    
+    @classmethod
+    def get_entries(cls) -> list[PageEntry]:
+        """Returns the metadata of every page without importing them."""
+        return list(cls._pages)
+    
+    @classmethod
+    def get_page_names(cls) -> list[str]:
+        return [entry.name for entry in cls._pages]
+    
+    @classmethod
+    def get_page_class(cls, name: str) -> type[BasePage]:
+        """Imports (once) and returns the class of the page with the given name."""
+        if name not in cls._loaded:
+            entry = next((entry for entry in cls._pages if entry.name == name), None)
+            if entry is None:
+                raise KeyError(f"Unknown page: {name}")
+            module = importlib.import_module(entry.module)
+            cls._loaded[name] = getattr(module, entry.class_name)
+        return cls._loaded[name]
+    
+    @classmethod
+    def create_page(cls, name: str) -> BasePage:
+        """Returns a fresh instance of the page with the given name."""
+        return cls.get_page_class(name)()
+    
     @classmethod
-    def get_pages(cls) -> list[type[BasePage]]:
-        """Returns new instances of all pages (legacy method)."""
-        return [page() for page in cls._pages]
+    def get_pages(cls) -> list[BasePage]:
+        """Returns new instances of all pages (legacy method, imports every page)."""
+        return [cls.create_page(entry.name) for entry in cls._pages]
     
     @classmethod
     def get_page_classes(cls) -> list[type[BasePage]]:
-        """Returns the page classes (not instances) to allow fresh instantiation."""
-        return cls._pages
+        """Returns the page classes (legacy method, imports every page)."""
+        return [cls.get_page_class(entry.name) for entry in cls._pages]
     
     @classmethod
-    def register_page(cls, page: type[BasePage]):
-        if page not in cls._pages:
-            cls._pages.append(page)
\ No newline at end of file
+    def register_page(cls, page: type[BasePage] | PageEntry):
+        """Registers a page from its metadata (lazy) or from an already imported class."""
+        if isinstance(page, PageEntry):
+            entry = page
+        else:
+            instance = page()
+            entry = PageEntry(instance.get_name(), page.__module__, page.__name__, instance.get_icon(), instance.get_description())
+            cls._loaded[entry.name] = page
+        
+        if entry.name not in cls.get_page_names():
+            cls._pages.append(entry)
@@ -0,0 +1,130 @@
+from typing import Optional, Any
+from project.UI.pages.page_base_reader import PageBaseReader
+import streamlit as st
+import pandas as pd
+from project.readers.reader_factory import ReaderFactory
+from project.readers.parsed_cache import get_default_cache
+from project.utils import app_logs
+from project.utils.hashing import get_file_hash, get_source_hash
+from project.utils.streamlit.download_utils import render_download_buttons
+from project.utils.streamlit.grid_utils import render_paginated_grid
+from project.processors.pipelines import BDV_READER_KWARGS, UTILIZACAO_READER_KWARGS, run_reconciliation
+from project.processors.reconciliation import KM_MISMATCH_TOLERANCE, DATE_TOLERANCE_DAYS, ISSUE_STATUSES
+
+KM_FORMAT = st.column_config.NumberColumn(format="%.1f km")
+
+
+class ReconciliationPage(PageBaseReader):
+    def __init__(self) -> None:
+        super().__init__(
+            page_name="Reconciliation",
+            icon="🔗",
+            description="Page to compare the km of BDV Consolidado trips with the Utilização odometer, per vehicle and day."
+        )
+        self.df_result: Optional[pd.DataFrame] = None
+        self.df_summary: Optional[pd.DataFrame] = None
+        self.df_issues: Optional[pd.DataFrame] = None
+    
+    def render(self) -> None:
+        st.title(f"{self._icon} {self.page_name}")
+        
+        if self._description:
+            st.markdown(self._description)
+            st.divider()
+        
+        app_logs.set_page_context(self.page_name)
+        
+        col_bdv, col_utilizacao = st.columns(2)
+        with col_bdv:
+            bdv_file = st.file_uploader("📒 BDV Consolidado", type=self.get_file_types(), key="reconciliation_bdv_file_uploader")
+        with col_utilizacao:
+            utilizacao_file = st.file_uploader("📚 Utilização", type=self.get_file_types(), key="reconciliation_utilizacao_file_uploader")
+        
+        col_km, col_days = st.columns(2)
+        with col_km:
+            st.number_input("Km tolerance:", min_value=0.0, value=KM_MISMATCH_TOLERANCE, step=1.0, key='reconciliation_km_tolerance', help="Maximum accepted km difference between the reports for a vehicle-day.")
+        with col_days:
+            st.number_input("Date tolerance (days):", min_value=0, max_value=7, value=DATE_TOLERANCE_DAYS, step=1, key='reconciliation_date_tolerance', help="BDV days without a Utilização record on the same day are matched to the nearest one within this many days.")
+        
+        if bdv_file and utilizacao_file:
+            self._process_files(bdv_file, utilizacao_file)
+        else:
+            st.info("📁 Upload both reports to reconcile them.")
+    
+    def _read_report(self, stage: str, uploaded_file: Any, file_hash: str, reader_kwargs: dict[str, Any]) -> pd.DataFrame:
+        """Read one of the reports once per session and file content."""
+        reader = ReaderFactory.create_reader(uploaded_file.name, default=self.reader_class, file_obj=uploaded_file, cache=get_default_cache(), **self.get_reader_kwargs(), **reader_kwargs)
+        
+        def read():
+            reader.safe_read()
+            return reader.df
+        
+        df = self._memoize(stage, (file_hash, repr(reader.get_cache_config())), read, input_bytes=getattr(uploaded_file, 'size', None))
+        if df is None:
+            # Failed reads are not memoized so a retry re-reads the file
+            self._get_memo().pop(stage, None)
+            raise ValueError(f"{uploaded_file.name} could not be read. Please check the format and try again.")
+        return df
+    
+    def _process_files(self, bdv_file: Any, utilizacao_file: Any) -> None:
+        with st.spinner("⏳ Reconciling reports..."):
+            try:
+                # Memoized per upload, so reruns do not read or hash the files again
+                bdv_hash = get_source_hash(bdv_file)
+                utilizacao_hash = get_source_hash(utilizacao_file)
+                self.file_hash = get_file_hash((bdv_hash + utilizacao_hash).encode())
+                
+                bdv = self._read_report('read_bdv', bdv_file, bdv_hash, BDV_READER_KWARGS)
+                utilizacao = self._read_report('read_utilizacao', utilizacao_file, utilizacao_hash, UTILIZACAO_READER_KWARGS)
+                st.success(f"✅ Reports read: {len(bdv):,} BDV trips and {len(utilizacao):,} Utilização records!")
+                
+                with self.timer.span('process_data') as span:
+                    self.process_data(bdv, utilizacao)
+                    span['rows'] = len(self.df_result)
+                
+                with self.timer.span('display_results'):
+                    self.display_results()
+            
+            except Exception as e:
+                st.error(f"❌ Unexpected error: {e}")
+        
+        self._render_perf_panel()
+    
+    def process_data(self, bdv: pd.DataFrame, utilizacao: pd.DataFrame) -> None:
+        """Match the vehicle-days of both reports and keep the ones that do not reconcile."""
+        km_tolerance = st.session_state.get('reconciliation_km_tolerance', KM_MISMATCH_TOLERANCE)
+        date_tolerance = st.session_state.get('reconciliation_date_tolerance', DATE_TOLERANCE_DAYS)
+        key = (self.file_hash, km_tolerance, date_tolerance)
+        
+        self.df_result, self.df_summary = self._memoize('reconcile', key, lambda: run_reconciliation(bdv, utilizacao, km_tolerance, date_tolerance))
+        self.df_issues = self._memoize('issues', key, lambda: self.df_result[self.df_result['Status'].isin(ISSUE_STATUSES)].reset_index(drop=True))
+    
+    def display_results(self) -> None:
+        """Display the per-vehicle summary and the vehicle-days that do not reconcile."""
+        if self.df_result is None:
+            st.error("❌ No data to display. Please upload both reports first.")
+            return
+        
+        km_columns = {column: KM_FORMAT for column in ('Km BDV', 'Km Inicial', 'Km Final', 'Km Utilização', 'Diferença', 'Total km diferença')}
+        
+        if self.df_issues.empty:
+            st.success(f"✅ All {len(self.df_result):,} vehicle-days reconcile.")
+        else:
+            st.warning(f"⚠️ {len(self.df_issues):,} of {len(self.df_result):,} vehicle-days do not reconcile:")
+            counts = self.df_issues['Status'].value_counts()
+            st.caption(" · ".join(f"{status}: {counts.get(status, 0):,}" for status in ISSUE_STATUSES))
+        
+        st.subheader("🚗 Per Vehicle")
+        render_paginated_grid(self.df_summary, key="reconciliation_summary_grid", column_config=km_columns)
+        
+        if not self.df_issues.empty:
+            st.subheader("📋 Vehicle-days With Issues")
+            render_paginated_grid(self.df_issues, key="reconciliation_issues_grid", column_config=km_columns)
+        
+        render_download_buttons(
+            self.df_result,
+            label="📥 Download Reconciliation",
+            file_stem="reconciliation",
+            key="reconciliation_download",
+            sheet_name='Reconciliation'
+        )
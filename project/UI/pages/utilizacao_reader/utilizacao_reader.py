@@ -2,8 +2,11 @@ from typing import Optional, Any
 from project.UI.pages.page_base_reader import PageBaseReader
 import streamlit as st
 import pandas as pd
-from io import BytesIO
-from project.readers.excel_reader import ExcelReader
+from project.readers.base_reader import BaseReader
+from project.utils.streamlit.download_utils import render_download_buttons
+from project.utils.streamlit.grid_utils import render_paginated_grid
+from project.processors.pipelines import UTILIZACAO_READER_KWARGS, run_utilizacao, run_utilizacao_incremental
+from project.processors.km_state import get_default_km_state
 import warnings
 
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
@@ -15,34 +18,49 @@ class UtilizacaoReader(PageBaseReader):
             icon="📚",
             description="Page for Utilização reports analysis."
         )
-        self.reader: Optional[ExcelReader] = None
+        self.reader: Optional[BaseReader] = None
         self.df_inconsistencias: Optional[pd.DataFrame] = None
+        self.history_updated: Optional[bool] = None
     
-    def _process_file(self, uploaded_file: Any) -> None:
-        """Process the uploaded Utilização file.
+    def render(self) -> None:
+        st.title(f"{self._icon} {self.page_name}")
         
-        Args:
-            uploaded_file: Streamlit UploadedFile object
-        """
-        with st.spinner("⏳ Processing Utilização file..."):
-            try:
-                self.reader = ExcelReader(file_obj=uploaded_file, header=3)
-                self.reader.safe_read()
-                
-                if self.reader.df is not None:
-                    st.success(f"✅ {self.reader.file_obj.name} file read successfully!")
-                    try:
-                        self.process_data()
-                    except Exception as e:
-                        st.error(f"❌ Processing error: {e}")
-                        return
-                    
-                    self.display_results()
-                else:
-                    st.error("❌ Error reading file. Please check the format and try again.")
-            except Exception as e:
-                st.error(f"❌ Unexpected error: {e}")
+        if self._description:
+            st.markdown(self._description)
+            st.divider()
+        
+        incremental = st.toggle(
+            "🔁 Incremental mode",
+            key='utilizacao_incremental',
+            help="Check the file against the last reading of each vehicle from the files added before, then add it to that history."
+        )
+        # Filled after the file is processed, so the counts include a file added on this run
+        history = st.container() if incremental else None
+        
+        self._render_uploader("utilização_reader_file_uploader")
+        
+        if history is not None:
+            with history:
+                self._render_history()
     
+    def _render_history(self) -> None:
+        store = get_default_km_state()
+        last_records, applied_files = store.load()
+        
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            st.info(f"🗂️ **History:** {len(applied_files)} files, {len(last_records):,} vehicles")
+        with col2:
+            if st.button("🗑️ Reset history", disabled=not applied_files, key='utilizacao_reset_history'):
+                store.clear()
+                self._get_memo().clear()
+                st.rerun()
+    
+    def get_reader_kwargs(self) -> dict[str, Any]:
+        return UTILIZACAO_READER_KWARGS
+    
+    def get_processing_message(self) -> str:
+        return "⏳ Processing Utilização file..."
     
     def process_data(self) -> None:
         """Process data to find KM inconsistencies between consecutive records."""
@@ -50,57 +68,38 @@ class UtilizacaoReader(PageBaseReader):
             st.error("❌ No data loaded. Please upload a file first.")
             return
         
-        df = self.reader.df.copy()
-        
-        if 'Km Inicial' in df.columns:
-            df['Km Inicial'] = pd.to_numeric(df['Km Inicial'], errors='coerce')
-        
-        if 'Km Final' in df.columns:
-            df['Km Final'] = pd.to_numeric(df['Km Final'], errors='coerce')
-        
-        inconsistencias = []
-        
-        for veiculo in df['Veículo'].unique():
-            df_veiculo: pd.DataFrame = df[df['Veículo'] == veiculo]
-            
-            for i in range(1, len(df_veiculo)):
-                km_final_anterior = df_veiculo.iloc[i-1]['Km Final']
-                km_inicial_atual = df_veiculo.iloc[i]['Km Inicial']
-                    
-                if pd.notna(km_final_anterior) and pd.notna(km_inicial_atual):
-                    if km_final_anterior != km_inicial_atual:
-                        diferenca = km_inicial_atual - km_final_anterior
-                        if diferenca > 10 or diferenca < 0:
-                            inconsistencias.append({
-                                'Veículo': veiculo,
-                                'Data Anterior': df_veiculo.iloc[i-1]['Data'],
-                                'Km Final Anterior': km_final_anterior,
-                                'Data Atual': df_veiculo.iloc[i]['Data'],
-                                'Km Inicial Atual': km_inicial_atual,
-                                'Diferença': km_inicial_atual - km_final_anterior
-                            })
+        if st.session_state.get('utilizacao_incremental', False):
+            # Memoized so reruns show the result of the check instead of re-adding the file
+            df, df_inconsistencias, self.history_updated = self._memoize(
+                'incremental', self.file_hash,
+                lambda: run_utilizacao_incremental(self.reader.df, get_default_km_state(), self.file_hash),
+                shared=False
+            )
+        else:
+            df, df_inconsistencias = self._memoize('transform', self.file_hash, lambda: run_utilizacao(self.reader.df))
+            self.history_updated = None
         
         self.reader.df = df
-        self.df_inconsistencias = pd.DataFrame(inconsistencias) if inconsistencias else None
+        self.df_inconsistencias = df_inconsistencias if not df_inconsistencias.empty else None
     
     def display_results(self) -> None:
         """Display the inconsistencies results and provide download option."""
+        if self.history_updated is True:
+            st.info("🗂️ File checked against the history and added to it.")
+        elif self.history_updated is False:
+            st.info("🗂️ This file is already in the history: it was only checked against its own rows.")
+        
         if self.df_inconsistencias is not None and len(self.df_inconsistencias) > 0:
             st.subheader("⚠️ KM Inconsistencies")
             st.warning(f"Found {len(self.df_inconsistencias)} inconsistencies where KM Final ≠ KM Inicial")
-            st.dataframe(self.df_inconsistencias, width='stretch', hide_index=True)
-            
-            buffer = BytesIO()
-            with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-                self.df_inconsistencias.to_excel(writer, index=False, sheet_name='Inconsistencies')
-            buffer.seek(0)
+            render_paginated_grid(self.df_inconsistencias, key="utilizacao_inconsistencies_grid")
             
-            st.download_button(
-                label="📥 Download Inconsistencies (Excel)",
-                data=buffer,
-                file_name="inconsistencias.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                key="utilizacao_download_inconsistencies"
+            render_download_buttons(
+                self.df_inconsistencias,
+                label="📥 Download Inconsistencies",
+                file_stem="inconsistencias",
+                key="utilizacao_download_inconsistencies",
+                sheet_name='Inconsistencies'
             )
         else:
             st.success("✅ No KM inconsistencies found! All odometer readings are continuous.")
\ No newline at end of file
@@ -1,6 +1,5 @@
 import streamlit as st
 from typing import Optional
-from project.UI.pages.base_page import BasePage
 from project.UI.pages.page_manager import PageManager
 
 class SideBar:
@@ -14,9 +13,7 @@ class SideBar:
             st.sidebar.write("Use the sidebar to navigate through different sections of the app.")
             st.sidebar.divider()
             
-            page_classes = PageManager.get_page_classes()
-            
-            options: list[str] = [page_cls().get_name() for page_cls in page_classes]
+            options: list[str] = PageManager.get_page_names()
             
             selection: Optional[str] = st.sidebar.radio("Go to", options)
             
@@ -33,10 +30,6 @@ class SideBar:
                         if key in st.session_state:
                             del st.session_state[key]
                 
-                for page_cls in page_classes:
-                    temp_instance = page_cls()
-                    if temp_instance.get_name() == selection:
-                        temp_instance.render()
-                        break
+                PageManager.create_page(selection).render()
         except Exception as e:
             st.sidebar.error(f"Error rendering sidebar: {e}")
\ No newline at end of file
@@ -0,0 +1,109 @@
+"""
+Command-line batch runner for the reader pipelines.
+
+Examples:
+    python -m project.cli bdv reports/*.xlsx --threshold 110 --out issues.parquet
+    python -m project.cli utilizacao utilizacao_*.xlsx --out inconsistencias.xlsx
+    python -m project.cli utilizacao garagens.xlsx --sheets "Garagem*" --out inconsistencias.xlsx
+    python -m project.cli utilizacao utilizacao_2025_02.xlsx --state state/km_state.parquet --out fev.xlsx
+"""
+
+import argparse
+import glob
+import sys
+from pathlib import Path
+
+from project.processors.bdv_consolidado import DEFAULT_SPEED_THRESHOLD
+from project.processors.pipelines import (
+    BDV_READER_KWARGS, UTILIZACAO_READER_KWARGS, run_bdv, bdv_issues, run_utilizacao, run_utilizacao_incremental
+)
+from project.processors.km_state import KmStateStore
+from project.readers.batch import SOURCE_FILE_COLUMN, read_files_parallel, combine_results
+from project.readers.excel_reader import ExcelReader
+from project.readers.parsed_cache import get_default_cache
+from project.utils.export import EXPORT_FORMATS, write_frame
+from project.utils.hashing import get_file_hash, get_source_hash
+
+
+def _expand_paths(patterns: list[str]) -> list[Path]:
+    """Expand glob patterns (shells like cmd.exe do not do it), keeping order and dropping duplicates."""
+    paths: dict[Path, None] = {}
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) or [pattern]
+        for match in matches:
+            paths[Path(match)] = None
+    return list(paths)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m project.cli", description="Run the SmartTools reader pipelines without the UI.")
+    subparsers = parser.add_subparsers(dest="report", required=True)
+    
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("files", nargs="+", help="Input files: xlsx, csv, parquet or arrow (glob patterns accepted)")
+    common.add_argument("--out", required=True, help=f"Output file ({', '.join(EXPORT_FORMATS)})")
+    common.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    common.add_argument("--no-cache", action="store_true", help="Do not use the parsed-file cache")
+    common.add_argument("--sheets", default=None, metavar="PATTERN", help="Excel only: read every sheet matching this glob (e.g. 'Garagem*') instead of the first one")
+    
+    bdv = subparsers.add_parser("bdv", parents=[common], help="BDV Consolidado speed/odometer check")
+    bdv.add_argument("--threshold", type=float, default=DEFAULT_SPEED_THRESHOLD, help="Average speed threshold in km/h")
+    
+    utilizacao = subparsers.add_parser("utilizacao", parents=[common], help="Utilização KM-continuity check")
+    utilizacao.add_argument("--state", default=None, help="Per-vehicle state file: check against it, then add these files to it")
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if Path(args.out).suffix.lower().lstrip('.') not in EXPORT_FORMATS:
+        parser.error(f"--out must end in one of: {', '.join('.' + fmt for fmt in EXPORT_FORMATS)}")
+    
+    paths = _expand_paths(args.files)
+    missing = [path for path in paths if not path.is_file()]
+    for path in missing:
+        print(f"❌ {path}: file not found", file=sys.stderr)
+    # Workers open the files themselves: only paths are sent to them
+    files = [(str(path), path) for path in paths if path.is_file()]
+    
+    reader_kwargs = dict(BDV_READER_KWARGS if args.report == "bdv" else UTILIZACAO_READER_KWARGS)
+    if not args.no_cache:
+        reader_kwargs['cache'] = get_default_cache()
+    if args.sheets:
+        excel_options = {**reader_kwargs['format_options'][ExcelReader], 'sheet_pattern': args.sheets}
+        reader_kwargs['format_options'] = {**reader_kwargs['format_options'], ExcelReader: excel_options}
+    
+    results = []
+    for result in read_files_parallel(ExcelReader, files, reader_kwargs, max_workers=args.workers):
+        if result.error:
+            print(f"❌ {result.name}: {result.error}", file=sys.stderr)
+        else:
+            print(f"✅ {result.name}: {len(result.df):,} rows")
+        results.append(result)
+    
+    df = combine_results(results)
+    if df is None:
+        print("❌ No file could be read.", file=sys.stderr)
+        return 1
+    
+    if args.report == "bdv":
+        output = bdv_issues(run_bdv(df, args.threshold), extra_columns=[SOURCE_FILE_COLUMN])
+    elif args.state:
+        # Same id as the page uses for a single upload / a batch upload
+        hashes = [get_source_hash(path) for _, path in files]
+        file_id = hashes[0] if len(hashes) == 1 else get_file_hash(''.join(hashes).encode())
+        _, output, updated = run_utilizacao_incremental(df, KmStateStore(args.state), file_id)
+        print(f"🗂️ State {'updated' if updated else 'unchanged (files already added)'}: {args.state}")
+    else:
+        _, output = run_utilizacao(df)
+    
+    write_frame(output, args.out)
+    print(f"📥 {len(output):,} issues written to {args.out}")
+    
+    failed = len(missing) + sum(result.error is not None for result in results)
+    return 2 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Vectorized speed and status computation for BDV Consolidado reports.
+"""
+
+from typing import Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+from project.processors.rules import Condition, Param, Rule, RuleSet
+from project.utils.durations import parse_hhmmss
+
+TIME_COLUMNS = ['Hora Saída', 'Hora Chegada', 'Tempo']
+
+STATUS_OK = 'OK'
+STATUS_OVER_SPEED = 'Over speed'
+STATUS_NEGATIVE_ODOMETER = 'Negative odometer'
+
+DEFAULT_SPEED_THRESHOLD = 100
+
+# Stored in DataFrame.attrs by `compute_status`: rows matched by each rule
+RULE_HITS_ATTR = 'rule_hits'
+
+# The most severe matching rule gives the status; add fleet rules here (or with `BDV_RULES.with_rules`)
+BDV_RULES = RuleSet([
+    Rule(STATUS_NEGATIVE_ODOMETER, [Condition('Km Rodado', '<', 0)], severity=2, description="Odometer went backwards"),
+    Rule(STATUS_OVER_SPEED, [Condition('Velocidade média', '>', Param('threshold'))], severity=1, description="Average speed above the threshold"),
+], default=STATUS_OK)
+
+ISSUE_STATUSES = BDV_RULES.labels
+
+
+def normalize_time_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Zero-pad the HH:MM:SS columns in place (e.g. '1:30:00' -> '01:30:00').
+    
+    Args:
+        df: BDV Consolidado DataFrame
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for column in TIME_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(str).str.zfill(8)
+    return df
+
+
+def compute_average_speed(df: pd.DataFrame) -> pd.DataFrame:
+    """Add 'Tempo (s)' and 'Velocidade média' (km/h) columns in place.
+    
+    Trips with a zero duration get speed 0; trips whose 'Tempo' is malformed
+    get <NA> seconds and a NaN speed instead of being silently treated as 0.
+    
+    Args:
+        df: BDV Consolidado DataFrame with 'Km Rodado' and 'Tempo'
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    seconds = parse_hhmmss(df['Tempo'])
+    df['Tempo (s)'] = seconds
+    
+    km = pd.to_numeric(df['Km Rodado'], errors='coerce').to_numpy(dtype=float)
+    secs = seconds.to_numpy(dtype=float, na_value=np.nan)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speed = np.where(secs > 0, km * 3600 / secs, 0.0)
+    speed[np.isnan(secs)] = np.nan
+    
+    df['Velocidade média'] = speed
+    return df
+
+
+def compute_status(df: pd.DataFrame, threshold: float = DEFAULT_SPEED_THRESHOLD, rules: RuleSet = BDV_RULES) -> pd.DataFrame:
+    """Add the 'Status' column in place: the label of the most severe matching rule, or 'OK'.
+    
+    Per-rule hit counts are stored in `df.attrs['rule_hits']`.
+    
+    Args:
+        df: DataFrame with the columns used by the rules ('Km Rodado', 'Velocidade média')
+        threshold: Average speed (km/h) above which a trip is flagged
+        rules: Rule set to apply (default: BDV_RULES)
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    result = rules.evaluate(df, {'threshold': threshold})
+    df['Status'] = result.labels
+    df.attrs[RULE_HITS_ATTR] = result.hits
+    return df
+
+
+def process_chunks(chunks: Iterable[pd.DataFrame], threshold: float = DEFAULT_SPEED_THRESHOLD) -> Iterator[pd.DataFrame]:
+    """Apply normalization, speed and status to a stream of chunks (e.g. `ExcelReader.read_chunks()`).
+    
+    The BDV rules only look at one row at a time, so each chunk is processed
+    independently and memory stays bounded by the chunk size.
+    
+    Args:
+        chunks: BDV Consolidado chunks
+        threshold: Average speed (km/h) above which a trip is flagged
+        
+    Yields:
+        Processed chunks
+    """
+    for chunk in chunks:
+        chunk = normalize_time_columns(chunk)
+        compute_average_speed(chunk)
+        compute_status(chunk, threshold)
+        yield chunk
@@ -0,0 +1,212 @@
+"""
+Columnar KM-continuity engine for Utilização reports.
+
+Compares the 'Km Inicial' of each record with the 'Km Final' of the previous
+record of the same vehicle using array operations, so it can run both from the
+Streamlit page and headless (scripts, benchmarks, batch jobs).
+"""
+
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+VEHICLE_COLUMN = 'Veículo'
+DATE_COLUMN = 'Data'
+KM_START_COLUMN = 'Km Inicial'
+KM_END_COLUMN = 'Km Final'
+
+REQUIRED_COLUMNS = [VEHICLE_COLUMN, DATE_COLUMN, KM_START_COLUMN, KM_END_COLUMN]
+
+INCONSISTENCY_COLUMNS = ['Veículo', 'Data Anterior', 'Km Final Anterior', 'Data Atual', 'Km Inicial Atual', 'Diferença']
+
+# A jump above this many km (or any negative jump) between consecutive records is an inconsistency
+KM_TOLERANCE = 10
+
+# Utilização exports write dates as text; Excel dates are already parsed
+DATE_FORMATS = ['%d/%m/%Y %H:%M:%S', '%d/%m/%Y', 'ISO8601']
+
+
+def coerce_km_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert the KM columns to numeric in place, invalid values become NaN.
+    
+    Args:
+        df: Utilização DataFrame
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for column in (KM_START_COLUMN, KM_END_COLUMN):
+        if column in df.columns:
+            df[column] = pd.to_numeric(df[column], errors='coerce')
+    return df
+
+
+def parse_record_dates(series: pd.Series) -> pd.Series:
+    """Parse report dates (dd/mm/yyyy [HH:MM:SS] text or Excel dates).
+    
+    Args:
+        series: Date column
+    
+    Returns:
+        datetime64 Series, NaT where the value is not a date
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series
+    
+    dates = pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+    for date_format in DATE_FORMATS:
+        pending = dates.isna() & series.notna()
+        if not pending.any():
+            break
+        dates[pending] = pd.to_datetime(series[pending], format=date_format, errors='coerce')
+    return dates
+
+
+def latest_records(df: pd.DataFrame) -> pd.DataFrame:
+    """Keep the most recent record of each vehicle by 'Data'.
+    
+    On equal dates the later row of `df` wins: same-day rows of a file keep
+    their file order, and `concat([new rows, state])` only replaces a
+    vehicle's state with a strictly later reading. Rows without a readable
+    date only count for vehicles that have no dated row.
+    
+    Args:
+        df: Records with REQUIRED_COLUMNS
+    
+    Returns:
+        One row per vehicle
+    """
+    df = df[df[VEHICLE_COLUMN].notna()].reset_index(drop=True)
+    order = parse_record_dates(df[DATE_COLUMN]).sort_values(kind='stable', na_position='first').index
+    return df.iloc[order].drop_duplicates(VEHICLE_COLUMN, keep='last').reset_index(drop=True)
+
+
+def find_km_inconsistencies(df: pd.DataFrame, tolerance: float = KM_TOLERANCE) -> pd.DataFrame:
+    """Find KM jumps between consecutive records of the same vehicle.
+    
+    Rows are grouped by vehicle once (stable sort, so the file order is kept
+    inside each vehicle) and each row is compared with the previous row of the
+    same vehicle. Vehicles are reported in order of first appearance.
+    
+    Args:
+        df: Utilização DataFrame with numeric 'Km Inicial' / 'Km Final' columns
+        tolerance: Maximum accepted positive difference in km
+        
+    Returns:
+        DataFrame with one row per inconsistency (empty if none found)
+        
+    Raises:
+        ValueError: If a required column is missing
+    """
+    missing = [column for column in REQUIRED_COLUMNS if column not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    
+    codes, vehicles = pd.factorize(df[VEHICLE_COLUMN])
+    
+    # Rows without a vehicle never match any group
+    valid_rows = np.flatnonzero(codes >= 0)
+    order = valid_rows[np.argsort(codes[valid_rows], kind='stable')]
+    
+    if len(order) < 2:
+        return pd.DataFrame(columns=INCONSISTENCY_COLUMNS)
+    
+    sorted_codes = codes[order]
+    km_end = df[KM_END_COLUMN].to_numpy()[order]
+    km_start = df[KM_START_COLUMN].to_numpy()[order]
+    
+    previous_end = km_end[:-1]
+    current_start = km_start[1:]
+    
+    same_vehicle = sorted_codes[1:] == sorted_codes[:-1]
+    both_present = pd.notna(previous_end) & pd.notna(current_start)
+    
+    with np.errstate(invalid='ignore'):
+        difference = current_start - previous_end
+        out_of_tolerance = (difference > tolerance) | (difference < 0)
+    
+    hits = np.flatnonzero(same_vehicle & both_present & out_of_tolerance)
+    previous_rows = order[hits]
+    current_rows = order[hits + 1]
+    
+    dates = df[DATE_COLUMN].to_numpy()
+    
+    return pd.DataFrame({
+        'Veículo': np.asarray(vehicles)[sorted_codes[hits + 1]],
+        'Data Anterior': dates[previous_rows],
+        'Km Final Anterior': previous_end[hits],
+        'Data Atual': dates[current_rows],
+        'Km Inicial Atual': current_start[hits],
+        'Diferença': difference[hits],
+    })
+
+
+class KmContinuityScanner:
+    """Streaming KM-continuity check over DataFrame chunks.
+    
+    Keeps the last record of every vehicle seen so far, so a jump between the
+    end of one chunk and the start of the next is still detected while only
+    one chunk is held in memory. Within a chunk, results follow the same order
+    as `find_km_inconsistencies`.
+    """
+    
+    def __init__(self, tolerance: float = KM_TOLERANCE, last_records: pd.DataFrame | None = None) -> None:
+        """
+        Args:
+            tolerance: Maximum accepted positive difference in km
+            last_records: Last record of each vehicle from earlier data (e.g. a
+                persisted state), so the first rows are checked against it
+        """
+        self.tolerance = tolerance
+        self.last_records: pd.DataFrame = pd.DataFrame(columns=REQUIRED_COLUMNS) if last_records is None else last_records[REQUIRED_COLUMNS]
+        self._results: list[pd.DataFrame] = []
+    
+    def update(self, chunk: pd.DataFrame) -> pd.DataFrame:
+        """Check one chunk against the carried state and the chunk's own rows.
+        
+        Args:
+            chunk: Next Utilização chunk, in file order
+            
+        Returns:
+            Inconsistencies found in this chunk
+        """
+        missing = [column for column in REQUIRED_COLUMNS if column not in chunk.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+        
+        current = coerce_km_columns(chunk[REQUIRED_COLUMNS].copy())
+        combined = pd.concat([self.last_records, current], ignore_index=True) if len(self.last_records) else current
+        
+        found = find_km_inconsistencies(combined, self.tolerance)
+        if not found.empty:
+            self._results.append(found)
+        
+        self.last_records = (
+            combined[combined[VEHICLE_COLUMN].notna()]
+            .drop_duplicates(VEHICLE_COLUMN, keep='last')
+            .reset_index(drop=True)
+        )
+        return found
+    
+    def result(self) -> pd.DataFrame:
+        """Return every inconsistency found so far as a single DataFrame."""
+        if not self._results:
+            return pd.DataFrame(columns=INCONSISTENCY_COLUMNS)
+        return pd.concat(self._results, ignore_index=True)
+
+
+def scan_km_inconsistencies(chunks: Iterable[pd.DataFrame], tolerance: float = KM_TOLERANCE) -> pd.DataFrame:
+    """Run the KM-continuity check over a stream of chunks (e.g. `ExcelReader.read_chunks()`).
+    
+    Args:
+        chunks: Utilização chunks, in file order
+        tolerance: Maximum accepted positive difference in km
+        
+    Returns:
+        DataFrame with every inconsistency found
+    """
+    scanner = KmContinuityScanner(tolerance)
+    for chunk in chunks:
+        scanner.update(chunk)
+    return scanner.result()
@@ -0,0 +1,144 @@
+"""
+Persisted per-vehicle odometer state for incremental Utilização checks.
+
+The state keeps the latest record by date ('Data', 'Km Inicial', 'Km Final')
+of every vehicle seen so far, plus the ids of the files already added. A new
+monthly file is checked against that state and its own rows only, so the
+jump between the last reading of one month and the first of the next is
+found without re-uploading the history. Files may arrive out of order: a
+vehicle's state only precedes the file's rows when it is older than them,
+and it is only replaced by a later reading.
+
+Updates hold a lock file next to the state (`km_state.parquet.lock`), so
+several server processes or CLI runs can add files to the same state
+without losing each other's updates.
+"""
+
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+from project.processors.km_continuity import (
+    DATE_COLUMN, KM_TOLERANCE, REQUIRED_COLUMNS, VEHICLE_COLUMN,
+    coerce_km_columns, find_km_inconsistencies, latest_records, parse_record_dates
+)
+from project.utils.file_lock import file_lock
+
+DEFAULT_STATE_PATH = os.environ.get("SMARTTOOLS_KM_STATE", os.path.join("state", "km_state.parquet"))
+
+# Stored in the Parquet metadata (DataFrame.attrs) so state and file list are written atomically together
+APPLIED_FILES_ATTR = 'applied_files'
+
+
+def _by_date(df: pd.DataFrame) -> pd.DataFrame:
+    """Rows in date order; equal dates keep their file order, unreadable dates go last."""
+    df = df.reset_index(drop=True)
+    order = parse_record_dates(df[DATE_COLUMN]).sort_values(kind='stable', na_position='last').index
+    return df.iloc[order].reset_index(drop=True)
+
+
+class KmStateStore:
+    
+    def __init__(self, path: str | Path = DEFAULT_STATE_PATH) -> None:
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name + ".lock")
+        self._lock = threading.Lock()
+    
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Exclude other threads of this process, then other processes."""
+        with self._lock, file_lock(self.lock_path):
+            yield
+    
+    def load(self) -> tuple[pd.DataFrame, list[str]]:
+        """Load the saved state.
+        
+        Returns:
+            Tuple (last record per vehicle, ids of the files already added);
+            an empty state if nothing was saved yet
+        """
+        try:
+            df = pd.read_parquet(self.path)
+        except FileNotFoundError:
+            return pd.DataFrame(columns=REQUIRED_COLUMNS), []
+        return df, list(df.attrs.get(APPLIED_FILES_ATTR, []))
+    
+    def save(self, last_records: pd.DataFrame, applied_files: list[str]) -> None:
+        """Replace the saved state (atomic write).
+        
+        Args:
+            last_records: Last record per vehicle
+            applied_files: Ids of the files included in the state
+        """
+        df = last_records[REQUIRED_COLUMNS].reset_index(drop=True)
+        df[VEHICLE_COLUMN] = df[VEHICLE_COLUMN].astype(str)
+        df.attrs[APPLIED_FILES_ATTR] = list(applied_files)
+        
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        os.close(fd)
+        try:
+            df.to_parquet(tmp_name, index=False)
+            os.replace(tmp_name, self.path)
+        finally:
+            if os.path.exists(tmp_name):
+                os.remove(tmp_name)
+    
+    def clear(self) -> None:
+        """Forget every vehicle and file."""
+        with self._locked():
+            self.path.unlink(missing_ok=True)
+    
+    def check_and_update(self, df: pd.DataFrame, file_id: str, tolerance: float = KM_TOLERANCE) -> tuple[pd.DataFrame, bool]:
+        """Check a new file against the state, then add it to the state.
+        
+        Rows are checked in date order. The saved record of a vehicle is
+        compared with its first new reading only when it is older, so a
+        month uploaded after a later one is checked against its own rows,
+        and the state keeps the latest reading of each vehicle.
+        
+        A file already added (same id) is only checked against its own rows
+        and the state is left untouched, so re-uploading it does not report
+        jumps against its own last readings.
+        
+        Args:
+            df: Utilização frame with 'Veículo', 'Data', 'Km Inicial' and 'Km Final'
+            file_id: Content hash of the file
+            tolerance: Maximum accepted positive difference in km
+            
+        Returns:
+            Tuple (inconsistencies, whether the state was updated)
+        """
+        current = _by_date(coerce_km_columns(df[REQUIRED_COLUMNS].copy()))
+        
+        # Held from load to save so concurrent updates never overwrite each other
+        with self._locked():
+            last_records, applied_files = self.load()
+            if file_id in applied_files:
+                return find_km_inconsistencies(current, tolerance), False
+            
+            first_dates = parse_record_dates(current[DATE_COLUMN]).groupby(current[VEHICLE_COLUMN].astype(str)).min()
+            state_dates = parse_record_dates(last_records[DATE_COLUMN])
+            newer = (state_dates >= last_records[VEHICLE_COLUMN].astype(str).map(first_dates)).to_numpy()
+            previous = last_records[~newer]
+            
+            found = find_km_inconsistencies(pd.concat([previous, current], ignore_index=True) if len(previous) else current, tolerance)
+            records = pd.concat([current, last_records], ignore_index=True) if len(last_records) else current
+            self.save(latest_records(records), applied_files + [file_id])
+            return found, True
+
+
+_default_store: KmStateStore | None = None
+
+
+def get_default_km_state() -> KmStateStore:
+    """Return the process-wide state store configured by SMARTTOOLS_KM_STATE."""
+    global _default_store
+    if _default_store is None:
+        _default_store = KmStateStore()
+    return _default_store
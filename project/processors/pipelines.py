@@ -0,0 +1,130 @@
+"""
+Read/process pipelines for the reader pages, independent of Streamlit.
+
+The pages and the command line (`python -m project.cli`) share the reader
+options and processing steps defined here.
+"""
+
+import pandas as pd
+
+from project.processors.bdv_consolidado import (
+    DEFAULT_SPEED_THRESHOLD, ISSUE_STATUSES, normalize_time_columns, compute_average_speed, compute_status
+)
+from project.processors.km_continuity import coerce_km_columns, find_km_inconsistencies
+from project.processors.km_state import KmStateStore
+from project.processors.reconciliation import KM_MISMATCH_TOLERANCE, DATE_TOLERANCE_DAYS, reconcile, reconciliation_summary
+from project.readers.excel_reader import ExcelReader
+
+# Only these columns are read; None keeps the parser's inference (Excel dates stay dates).
+# Low-cardinality text is read as categorical to keep large reports small in memory.
+BDV_SCHEMA = {
+    'Data': None,
+    'Itinerários': 'category',
+    'Hora Saída': str,
+    'Hora Chegada': str,
+    'Tempo': str,
+    'Km Rodado': 'float',
+    'Placa': 'category',
+    'Organização': 'category',
+}
+UTILIZACAO_SCHEMA = {
+    'Veículo': 'category',
+    'Data': str,
+    'Km Inicial': 'float',
+    'Km Final': 'float',
+}
+
+# Excel exports have title rows above the column names; CSV, Parquet and Arrow files start with them,
+# so the header offset only applies to the Excel reader (see ReaderFactory.create_reader).
+BDV_EXCEL_HEADER = 2
+UTILIZACAO_EXCEL_HEADER = 3
+
+BDV_READER_KWARGS = {'schema': BDV_SCHEMA, 'format_options': {ExcelReader: {'header': BDV_EXCEL_HEADER}}}
+UTILIZACAO_READER_KWARGS = {'schema': UTILIZACAO_SCHEMA, 'format_options': {ExcelReader: {'header': UTILIZACAO_EXCEL_HEADER}}}
+
+BDV_REPORT_COLUMNS = ['Data', 'Itinerários', 'Hora Saída', 'Hora Chegada', 'Tempo', 'Km Rodado', 'Placa', 'Organização', 'Velocidade média', 'Status']
+
+
+def transform_bdv(df: pd.DataFrame) -> pd.DataFrame:
+    """Threshold-independent BDV stage: normalized times and average speed (returns a new frame)."""
+    return compute_average_speed(normalize_time_columns(df.copy()))
+
+
+def apply_bdv_status(df: pd.DataFrame, threshold: float = DEFAULT_SPEED_THRESHOLD) -> pd.DataFrame:
+    """Threshold-dependent BDV stage: 'Status' column (returns a new frame sharing the data of `df`)."""
+    return compute_status(df.copy(deep=False), threshold)
+
+
+def bdv_issues(df: pd.DataFrame, extra_columns: list[str] | None = None) -> pd.DataFrame:
+    """Select the flagged BDV trips with the report columns.
+    
+    Args:
+        df: BDV frame with 'Status'
+        extra_columns: Additional columns to keep when present (e.g. source file)
+        
+    Returns:
+        Flagged rows only
+    """
+    columns = BDV_REPORT_COLUMNS + [column for column in (extra_columns or []) if column in df.columns]
+    return df.loc[df['Status'].isin(ISSUE_STATUSES), columns]
+
+
+def run_bdv(df: pd.DataFrame, threshold: float = DEFAULT_SPEED_THRESHOLD) -> pd.DataFrame:
+    """Full BDV pipeline on a parsed frame.
+    
+    Args:
+        df: Parsed BDV Consolidado frame
+        threshold: Average speed (km/h) above which a trip is flagged
+        
+    Returns:
+        Processed frame with 'Velocidade média' and 'Status'
+    """
+    return apply_bdv_status(transform_bdv(df), threshold)
+
+
+def run_utilizacao(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Full Utilização pipeline on a parsed frame.
+    
+    Args:
+        df: Parsed Utilização frame
+        
+    Returns:
+        Tuple (frame with numeric KM columns, inconsistencies)
+    """
+    df = coerce_km_columns(df.copy())
+    return df, find_km_inconsistencies(df)
+
+
+def run_utilizacao_incremental(df: pd.DataFrame, store: KmStateStore, file_id: str) -> tuple[pd.DataFrame, pd.DataFrame, bool]:
+    """Utilização pipeline checked against, and then added to, the persisted per-vehicle state.
+    
+    Args:
+        df: Parsed Utilização frame (one new period)
+        store: Persisted state of the previous periods
+        file_id: Content hash of the input, so the same file is not added twice
+        
+    Returns:
+        Tuple (frame with numeric KM columns, inconsistencies, whether the state was updated)
+    """
+    df = coerce_km_columns(df.copy())
+    inconsistencies, updated = store.check_and_update(df, file_id)
+    return df, inconsistencies, updated
+
+
+def run_reconciliation(bdv: pd.DataFrame,
+                       utilizacao: pd.DataFrame,
+                       km_tolerance: float = KM_MISMATCH_TOLERANCE,
+                       date_tolerance_days: int = DATE_TOLERANCE_DAYS) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """BDV Consolidado ↔ Utilização reconciliation on parsed frames.
+    
+    Args:
+        bdv: Parsed BDV Consolidado frame
+        utilizacao: Parsed Utilização frame
+        km_tolerance: Maximum accepted km difference per vehicle-day
+        date_tolerance_days: Maximum distance in days for as-of matched days
+        
+    Returns:
+        Tuple (one row per vehicle-day, per-vehicle summary)
+    """
+    result = reconcile(bdv, utilizacao, km_tolerance, date_tolerance_days)
+    return result, reconciliation_summary(result)
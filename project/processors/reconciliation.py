@@ -0,0 +1,206 @@
+"""
+BDV Consolidado ↔ Utilização reconciliation.
+
+Both reports are reduced to one row per vehicle-day (km driven in the BDV
+trips, odometer distance in the Utilização records) on integer vehicle codes
+shared by the two reports. Days are then matched per vehicle: exact days
+first, then the remaining ones with an as-of join to the nearest day within
+a tolerance, so a year of both reports is reconciled in a few sorts and
+joins.
+"""
+
+import numpy as np
+import pandas as pd
+
+from project.processors.km_continuity import KM_START_COLUMN, KM_END_COLUMN, VEHICLE_COLUMN, parse_record_dates
+
+BDV_VEHICLE_COLUMN = 'Placa'
+BDV_KM_COLUMN = 'Km Rodado'
+DATE_COLUMN = 'Data'
+
+RECONCILIATION_COLUMNS = [
+    'Veículo', 'Data BDV', 'Viagens', 'Km BDV',
+    'Data Utilização', 'Registros', 'Km Inicial', 'Km Final', 'Km Utilização',
+    'Diferença', 'Status'
+]
+
+STATUS_OK = 'OK'
+STATUS_KM_MISMATCH = 'Km mismatch'
+STATUS_MISSING_UTILIZACAO = 'Missing in Utilização'
+STATUS_MISSING_BDV = 'Missing in BDV'
+
+ISSUE_STATUSES = [STATUS_KM_MISMATCH, STATUS_MISSING_UTILIZACAO, STATUS_MISSING_BDV]
+
+# A vehicle-day is a mismatch when the two reports differ by more than this many km
+KM_MISMATCH_TOLERANCE = 5.0
+
+# BDV days without a Utilização record on the same day are matched to the nearest one within this many days
+DATE_TOLERANCE_DAYS = 1
+
+
+def normalize_vehicle_keys(series: pd.Series) -> np.ndarray:
+    """Uppercase the vehicle identifiers and drop separators ('abc-1d23' -> 'ABC1D23').
+    
+    Only the distinct values are normalized, so categorical columns cost one
+    string operation per vehicle.
+    
+    Args:
+        series: Plates or vehicle codes
+    
+    Returns:
+        Object array of keys, None where the identifier is missing or empty
+    """
+    codes, uniques = pd.factorize(series)
+    normalized = pd.Index(uniques.astype(str)).str.upper().str.replace(r'[^0-9A-Z]', '', regex=True).to_numpy(dtype=object)
+    normalized[normalized == ''] = None
+    
+    keys = np.empty(len(codes), dtype=object)
+    valid = codes >= 0
+    keys[valid] = normalized[codes[valid]]
+    return keys
+
+
+def parse_report_days(series: pd.Series) -> pd.Series:
+    """Parse report dates (dd/mm/yyyy text or Excel dates) and truncate them to the day.
+    
+    Args:
+        series: Date column
+    
+    Returns:
+        datetime64 Series, NaT where the value is not a date
+    """
+    return parse_record_dates(series).dt.normalize()
+
+
+def _daily(codes: np.ndarray, days: pd.Series, values: dict[str, tuple[np.ndarray, str]]) -> pd.DataFrame:
+    """Aggregate rows per (vehicle code, day), dropping rows without either."""
+    frame = pd.DataFrame({'code': codes, 'day': days.to_numpy(), **{name: array for name, (array, _) in values.items()}})
+    frame = frame[(codes >= 0) & frame['day'].notna().to_numpy()]
+    return frame.groupby(['code', 'day'], sort=False).agg(**{name: (name, how) for name, (_, how) in values.items()}).reset_index()
+
+
+def _match_days(bdv_daily: pd.DataFrame, util_daily: pd.DataFrame, date_tolerance_days: int) -> np.ndarray:
+    """Row of `util_daily` matched by each row of `bdv_daily` (-1 when none).
+    
+    Exact days are matched first. The remaining BDV days take the nearest
+    remaining Utilização day of the same vehicle within the tolerance; when
+    several want the same one, the closest wins.
+    """
+    matches = np.full(len(bdv_daily), -1, dtype=np.int64)
+    
+    exact = pd.MultiIndex.from_frame(util_daily[['code', 'day']]).get_indexer(pd.MultiIndex.from_frame(bdv_daily[['code', 'day']]))
+    matches[:] = exact
+    
+    if date_tolerance_days <= 0:
+        return matches
+    
+    left = bdv_daily.loc[matches < 0, ['code', 'day']].assign(left_row=np.flatnonzero(matches < 0))
+    taken = np.zeros(len(util_daily), dtype=bool)
+    taken[matches[matches >= 0]] = True
+    right = util_daily.loc[~taken, ['code', 'day']].assign(right_row=np.flatnonzero(~taken), right_day=lambda frame: frame['day'])
+    if left.empty or right.empty:
+        return matches
+    
+    nearest = pd.merge_asof(
+        left.sort_values('day'), right.sort_values('day'),
+        on='day', by='code', direction='nearest',
+        tolerance=pd.Timedelta(days=date_tolerance_days)
+    ).dropna(subset=['right_row'])
+    
+    nearest['gap'] = (nearest['day'] - nearest['right_day']).abs()
+    nearest = nearest.sort_values('gap', kind='stable').drop_duplicates('right_row')
+    matches[nearest['left_row'].to_numpy()] = nearest['right_row'].to_numpy(dtype=np.int64)
+    return matches
+
+
+def reconcile(bdv: pd.DataFrame,
+              utilizacao: pd.DataFrame,
+              km_tolerance: float = KM_MISMATCH_TOLERANCE,
+              date_tolerance_days: int = DATE_TOLERANCE_DAYS) -> pd.DataFrame:
+    """Compare the km of each vehicle-day in the BDV trips and the Utilização odometer.
+    
+    Args:
+        bdv: BDV Consolidado frame ('Placa', 'Data', 'Km Rodado')
+        utilizacao: Utilização frame ('Veículo', 'Data', 'Km Inicial', 'Km Final')
+        km_tolerance: Maximum accepted difference in km
+        date_tolerance_days: Maximum distance in days for BDV days without a same-day Utilização record
+    
+    Returns:
+        One row per vehicle-day (RECONCILIATION_COLUMNS), sorted by vehicle and day.
+        'Diferença' is Km BDV - Km Utilização.
+    
+    Raises:
+        ValueError: If a required column is missing
+    """
+    for name, df, columns in (
+        ("BDV", bdv, [BDV_VEHICLE_COLUMN, DATE_COLUMN, BDV_KM_COLUMN]),
+        ("Utilização", utilizacao, [VEHICLE_COLUMN, DATE_COLUMN, KM_START_COLUMN, KM_END_COLUMN]),
+    ):
+        missing = [column for column in columns if column not in df.columns]
+        if missing:
+            raise ValueError(f"{name}: missing required columns: {', '.join(missing)}")
+    
+    # One code space for both reports, so vehicles are compared as integers
+    keys = np.concatenate([normalize_vehicle_keys(bdv[BDV_VEHICLE_COLUMN]), normalize_vehicle_keys(utilizacao[VEHICLE_COLUMN])])
+    codes, vehicles = pd.factorize(keys, sort=True)
+    bdv_codes, util_codes = codes[:len(bdv)], codes[len(bdv):]
+    
+    km_start = pd.to_numeric(utilizacao[KM_START_COLUMN], errors='coerce').to_numpy(dtype=float)
+    km_end = pd.to_numeric(utilizacao[KM_END_COLUMN], errors='coerce').to_numpy(dtype=float)
+    
+    bdv_daily = _daily(bdv_codes, parse_report_days(bdv[DATE_COLUMN]), {
+        'Viagens': (np.ones(len(bdv), dtype=np.int64), 'sum'),
+        'Km BDV': (pd.to_numeric(bdv[BDV_KM_COLUMN], errors='coerce').to_numpy(dtype=float), 'sum'),
+    })
+    util_daily = _daily(util_codes, parse_report_days(utilizacao[DATE_COLUMN]), {
+        'Registros': (np.ones(len(utilizacao), dtype=np.int64), 'sum'),
+        'Km Inicial': (km_start, 'min'),
+        'Km Final': (km_end, 'max'),
+        'Km Utilização': (km_end - km_start, 'sum'),
+    })
+    
+    matches = _match_days(bdv_daily, util_daily, date_tolerance_days)
+    matched = matches >= 0
+    
+    util_columns = ['Registros', 'Km Inicial', 'Km Final', 'Km Utilização']
+    left = bdv_daily.rename(columns={'day': 'Data BDV'})
+    # Unmatched rows (-1) become NaN
+    right = util_daily.reindex(matches).reset_index(drop=True).rename(columns={'day': 'Data Utilização'})
+    for column in ['Data Utilização'] + util_columns:
+        left[column] = right[column]
+    
+    unmatched = np.ones(len(util_daily), dtype=bool)
+    unmatched[matches[matched]] = False
+    only_util = util_daily[unmatched].rename(columns={'day': 'Data Utilização'})
+    
+    result = pd.concat([left, only_util], ignore_index=True)
+    result['Diferença'] = result['Km BDV'] - result['Km Utilização']
+    
+    with np.errstate(invalid='ignore'):
+        result['Status'] = np.select(
+            [result['Data BDV'].isna(), result['Data Utilização'].isna(), np.abs(result['Diferença'].to_numpy(dtype=float)) > km_tolerance],
+            [STATUS_MISSING_BDV, STATUS_MISSING_UTILIZACAO, STATUS_KM_MISMATCH],
+            default=STATUS_OK
+        )
+    
+    for column in ('Viagens', 'Registros'):
+        result[column] = result[column].astype('Int64')
+    result['Veículo'] = pd.Categorical.from_codes(result['code'].to_numpy(), categories=vehicles)
+    result['day'] = result['Data BDV'].fillna(result['Data Utilização'])
+    result = result.sort_values(['Veículo', 'day'], kind='stable', ignore_index=True)
+    return result[RECONCILIATION_COLUMNS]
+
+
+def reconciliation_summary(result: pd.DataFrame) -> pd.DataFrame:
+    """Count the vehicle-days of each status per vehicle, vehicles with most issues first.
+    
+    Args:
+        result: Output of `reconcile`
+    
+    Returns:
+        DataFrame with 'Veículo', one column per status and 'Total km diferença'
+    """
+    counts = pd.crosstab(result['Veículo'], result['Status']).reindex(columns=[STATUS_OK] + ISSUE_STATUSES, fill_value=0)
+    counts['Total km diferença'] = result['Diferença'].abs().groupby(result['Veículo'], observed=True).sum()
+    counts = counts.sort_values(ISSUE_STATUSES, ascending=False)
+    return counts.reset_index().rename_axis(columns=None)
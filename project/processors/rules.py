@@ -0,0 +1,174 @@
+"""
+Declarative, vectorized row-flagging rules.
+
+A rule is a label, a severity and a list of column conditions (all must
+hold). A RuleSet compiles its rules once and evaluates them over a whole
+DataFrame with NumPy boolean masks, in a single pass per rule, so adding
+rules does not add per-row Python.
+
+Values can be parameters (`Param('threshold')`) resolved at evaluation
+time, so a rule set is compiled once and reused with different settings.
+
+Example:
+    rules = RuleSet([
+        Rule('Negative odometer', [Condition('Km Rodado', '<', 0)], severity=2),
+        Rule('Over speed', [Condition('Velocidade média', '>', Param('threshold'))], severity=1),
+    ], default='OK')
+    result = rules.evaluate(df, {'threshold': 100})
+    df['Status'] = result.labels
+"""
+
+import operator
+from typing import Any, Callable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+FIRST_MATCH = 'first'
+ALL_MATCHES = 'all'
+
+MULTI_LABEL_SEPARATOR = ', '
+
+
+class Param(NamedTuple):
+    """Placeholder for a value supplied when the rules are evaluated."""
+    name: str
+
+
+class Condition(NamedTuple):
+    column: str
+    op: str
+    value: Any = None
+
+
+class Rule(NamedTuple):
+    label: str
+    conditions: list[Condition]
+    severity: int = 1
+    description: str = ""
+
+
+class RuleResult(NamedTuple):
+    labels: np.ndarray
+    masks: dict[str, np.ndarray]
+    hits: dict[str, int]
+
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    '==': operator.eq,
+    '!=': operator.ne,
+}
+
+_PREDICATES: dict[str, Callable[[pd.Series, Any], np.ndarray]] = {
+    'isna': lambda series, _: series.isna().to_numpy(),
+    'notna': lambda series, _: series.notna().to_numpy(),
+    'isin': lambda series, values: series.isin(values).to_numpy(),
+    'notin': lambda series, values: ~series.isin(values).to_numpy(),
+    'contains': lambda series, text: series.astype('string').str.contains(text, regex=False).fillna(False).to_numpy(dtype=bool),
+}
+
+OPERATORS = list(_COMPARISONS) + list(_PREDICATES)
+
+
+def _compile_condition(condition: Condition) -> Callable[[pd.DataFrame, dict[str, Any]], np.ndarray]:
+    if condition.op not in OPERATORS:
+        raise ValueError(f"Unknown operator '{condition.op}' (use one of {', '.join(OPERATORS)})")
+    
+    def resolve(params: dict[str, Any]) -> Any:
+        if isinstance(condition.value, Param):
+            if condition.value.name not in params:
+                raise ValueError(f"Missing rule parameter: {condition.value.name}")
+            return params[condition.value.name]
+        return condition.value
+    
+    if condition.op in _PREDICATES:
+        predicate = _PREDICATES[condition.op]
+        return lambda df, params: predicate(df[condition.column], resolve(params))
+    
+    compare = _COMPARISONS[condition.op]
+    
+    def evaluate(df: pd.DataFrame, params: dict[str, Any]) -> np.ndarray:
+        value = resolve(params)
+        series = df[condition.column]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            # Numeric comparison: text numbers are coerced, invalid values never match
+            values = pd.to_numeric(series, errors='coerce').to_numpy(dtype=float)
+            with np.errstate(invalid='ignore'):
+                return compare(values, value)
+        return compare(series, value).fillna(False).to_numpy(dtype=bool)
+    
+    return evaluate
+
+
+class RuleSet:
+    
+    def __init__(self, rules: list[Rule], default: str = "OK") -> None:
+        """
+        Args:
+            rules: Rules, evaluated by descending severity (declaration order breaks ties)
+            default: Label of rows matching no rule
+        
+        Raises:
+            ValueError: If labels are duplicated, a rule has no condition or an operator is unknown
+        """
+        labels = [rule.label for rule in rules]
+        duplicated = sorted({label for label in labels if labels.count(label) > 1})
+        if duplicated:
+            raise ValueError(f"Duplicated rule labels: {', '.join(duplicated)}")
+        
+        self.default = default
+        self.rules = sorted(rules, key=lambda rule: -rule.severity)
+        self._compiled: list[tuple[Rule, list[Callable]]] = []
+        for rule in self.rules:
+            if not rule.conditions:
+                raise ValueError(f"Rule '{rule.label}' has no condition")
+            self._compiled.append((rule, [_compile_condition(condition) for condition in rule.conditions]))
+    
+    @property
+    def labels(self) -> list[str]:
+        """Rule labels by descending severity."""
+        return [rule.label for rule in self.rules]
+    
+    def with_rules(self, rules: list[Rule]) -> 'RuleSet':
+        """Return a new rule set with extra rules (e.g. fleet-specific ones)."""
+        return RuleSet(self.rules + list(rules), default=self.default)
+    
+    def evaluate(self, df: pd.DataFrame, params: dict[str, Any] | None = None, mode: str = FIRST_MATCH) -> RuleResult:
+        """Evaluate every rule over the frame.
+        
+        Args:
+            df: Data to flag
+            params: Values for the rules' `Param` placeholders
+            mode: 'first' gives each row the label of its most severe matching
+                rule; 'all' joins every matching label with ', '
+        
+        Returns:
+            RuleResult with one label per row, the mask of each rule and its hit count
+            (rows matching the rule, whether or not a more severe rule also matched)
+        
+        Raises:
+            ValueError: If the mode is unknown or a parameter is missing
+        """
+        params = params or {}
+        masks: dict[str, np.ndarray] = {}
+        for rule, conditions in self._compiled:
+            mask = np.ones(len(df), dtype=bool)
+            for condition in conditions:
+                mask &= condition(df, params)
+            masks[rule.label] = mask
+        
+        if mode == FIRST_MATCH:
+            labels = np.select(list(masks.values()), list(masks), default=self.default) if masks else np.full(len(df), self.default, dtype=object)
+        elif mode == ALL_MATCHES:
+            labels = np.full(len(df), "", dtype=object)
+            for label, mask in masks.items():
+                labels[mask] = np.where(labels[mask] == "", label, labels[mask] + MULTI_LABEL_SEPARATOR + label)
+            labels[labels == ""] = self.default
+        else:
+            raise ValueError(f"Unknown evaluation mode: {mode} (use '{FIRST_MATCH}' or '{ALL_MATCHES}')")
+        
+        return RuleResult(labels, masks, {label: int(mask.sum()) for label, mask in masks.items()})
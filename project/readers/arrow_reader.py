@@ -0,0 +1,55 @@
+import pandas as pd
+from typing import Iterator
+from project.readers.base_reader import BaseReader
+from project.readers.schema import apply_schema
+
+
+class ArrowReader(BaseReader):
+    """Reader for Arrow IPC / Feather v2 files."""
+    
+    # Arrow IPC is already a fast columnar format, re-caching it would only duplicate it
+    cacheable = False
+    
+    def _open(self):
+        import pyarrow as pa
+        
+        if isinstance(self.file_obj, str) or hasattr(self.file_obj, '__fspath__'):
+            source = pa.memory_map(str(self.file_obj), 'r')
+        else:
+            source = pa.BufferReader(self.file_obj.getvalue() if hasattr(self.file_obj, 'getvalue') else self.file_obj.read())
+        return pa.ipc.open_file(source)
+    
+    def _to_frame(self, data) -> pd.DataFrame:
+        if self.schema:
+            data = data.select(list(self.schema))
+        df = data.to_pandas()
+        return apply_schema(df, self.schema) if self.schema else df
+    
+    def read(self) -> None:
+        """Read the file into `self.df`, loading only the schema columns.
+        
+        Paths are memory-mapped, so only the projected columns are touched.
+        """
+        try:
+            table = self._open().read_all()
+        except Exception as e:
+            raise ValueError(f"Error reading Arrow file: {e}")
+        
+        self.df = self._to_frame(table)
+    
+    def read_chunks(self, chunk_size: int | None = None) -> Iterator[pd.DataFrame]:
+        """Stream the file one record batch at a time (the writer's batch size is kept).
+        
+        Yields:
+            DataFrame chunks
+        """
+        try:
+            reader = self._open()
+        except Exception as e:
+            raise ValueError(f"Error reading Arrow file: {e}")
+        
+        for i in range(reader.num_record_batches):
+            yield self._to_frame(reader.get_batch(i))
+    
+    def validate(self) -> bool:
+        return self.df is not None and not self.df.empty
@@ -1,14 +1,23 @@
 import pandas as pd
+from typing import Any, Iterator
+from project.utils.hashing import get_source_hash
+from project.utils.memory import compact_frame
 
 class BaseReader:
     
-    def __init__(self, file_obj = None, encoding: str = 'utf-8', header: int = 0, skiprows: int = 0, dtype: dict | type = str, **kwargs) -> None:
+    # Set to False for formats that are already fast to load (no point caching them)
+    cacheable: bool = True
+    
+    def __init__(self, file_obj = None, encoding: str = 'utf-8', header: int = 0, skiprows: int = 0, dtype: dict | type = str, schema: dict | None = None, compact: bool = False, cache = None, **kwargs) -> None:
         self.file_obj = file_obj
         self.encoding:str = encoding
         self.header: int = header
         self.skiprows: int = skiprows
         self.dtype: dict | type = dtype
+        self.schema: dict | None = schema
+        self.compact: bool = compact
         self.reader_config: dict = kwargs
+        self.cache = cache
         self.df: pd.DataFrame | None = None
     
     def set_file_obj(self, file_obj) -> 'BaseReader':
@@ -23,19 +32,74 @@ class BaseReader:
         self.header = header
         return self
     
+    def set_schema(self, schema: dict | None) -> 'BaseReader':
+        self.schema = schema
+        return self
+    
+    def set_compact(self, compact: bool) -> 'BaseReader':
+        self.compact = compact
+        return self
+    
     def set_config(self, key: str, value) -> 'BaseReader':
         self.reader_config[key] = value
         return self
     
+    def set_cache(self, cache) -> 'BaseReader':
+        self.cache = cache
+        return self
+    
+    def get_cache_config(self) -> dict[str, Any]:
+        """Return every option that changes the parsed result, used in the cache key."""
+        return {
+            'reader': type(self).__name__,
+            'encoding': self.encoding,
+            'header': self.header,
+            'skiprows': self.skiprows,
+            'dtype': self.dtype,
+            'schema': self.schema,
+            'compact': self.compact,
+            'config': self.reader_config,
+        }
+    
+    def cached_read(self) -> None:
+        """Read the file, going through the parsed-file cache when one is set.
+        
+        With `compact`, the parsed frame gets memory-compact dtypes (see
+        `compact_frame`) before it is cached. Chunked reads are not compacted.
+        """
+        if self.cache is None or not self.cacheable:
+            self._read_compact()
+            return
+        
+        file_hash = get_source_hash(self.file_obj)
+        key = self.cache.make_key(file_hash, self.get_cache_config())
+        
+        cached = self.cache.get(key)
+        if cached is not None:
+            self.df = cached
+            return
+        
+        self._read_compact()
+        if self.df is not None:
+            self.cache.put(key, self.df)
+    
+    def _read_compact(self) -> None:
+        self.read()
+        if self.compact and self.df is not None:
+            self.df = compact_frame(self.df)
+    
     def read(self) -> None:
         raise NotImplementedError("Subclasses must implement this method")
     
+    def read_chunks(self, chunk_size: int | None = None) -> Iterator[pd.DataFrame]:
+        raise NotImplementedError("Subclasses must implement this method")
+    
     def safe_read(self) -> bool:
         try:
             if self.file_obj is None:
                 raise ValueError("No file was provided")
             
-            self.read()
+            self.cached_read()
             return True
         
         except Exception as e:
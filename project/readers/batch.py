@@ -0,0 +1,133 @@
+"""
+Parallel parsing of several files with a process pool.
+
+openpyxl parsing is CPU-bound and holds the GIL, so each file is parsed in its
+own worker process (sheets of multi-sheet workbooks are then parsed inside
+that worker, not in a nested pool). Failures are reported per file and never
+abort the batch.
+"""
+
+import os
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import as_completed
+from typing import Any, Iterator, NamedTuple
+
+import pandas as pd
+
+from project.readers.base_reader import BaseReader
+from project.readers.excel_reader import ExcelReader
+from project.readers.reader_factory import ReaderFactory
+from project.utils.memory import concat_labeled
+from project.utils.pools import process_pool
+
+SOURCE_FILE_COLUMN = 'Arquivo'
+
+
+class BatchResult(NamedTuple):
+    name: str
+    df: pd.DataFrame | None
+    error: str | None
+    # Position of the file in the submitted list (names can repeat)
+    index: int = 0
+
+
+def _read_one(reader_class: type[BaseReader], reader_kwargs: dict[str, Any], index: int, name: str, source: bytes | str | Path, in_pool: bool = False) -> BatchResult:
+    """Worker: parse a single file. Must stay at module level to be picklable.
+    
+    `source` is the file content or a path; a path is opened here, so only the
+    path (not the content) is sent to the worker.
+    """
+    try:
+        file_obj = BytesIO(source) if isinstance(source, bytes) else source
+        reader = ReaderFactory.create_reader(name, default=reader_class, file_obj=file_obj, **reader_kwargs)
+        if in_pool and isinstance(reader, ExcelReader):
+            # Files already use every CPU: parse the sheets here instead of nesting another pool
+            reader.set_sheet_workers(1)
+        reader.cached_read()
+        if reader.df is None:
+            return BatchResult(name, None, "No data was read", index)
+        return BatchResult(name, reader.df, None, index)
+    except Exception as e:
+        return BatchResult(name, None, str(e), index)
+
+
+def read_files_parallel(reader_class: type[BaseReader],
+                        files: list[tuple[str, bytes | str | Path]],
+                        reader_kwargs: dict[str, Any] | None = None,
+                        max_workers: int | None = None) -> Iterator[BatchResult]:
+    """Parse files in parallel, yielding each result as soon as it is ready.
+    
+    Args:
+        reader_class: Fallback reader for files whose extension is not registered in ReaderFactory
+        files: List of (file name, file content or path) pairs; paths are read by the workers
+        reader_kwargs: Extra reader options (schema, cache, format_options...)
+        max_workers: Worker processes (default: one per CPU, at most one per file)
+    
+    Yields:
+        BatchResult per file, in completion order (`index` is its position in `files`)
+    """
+    reader_kwargs = reader_kwargs or {}
+    if not files:
+        return
+    
+    max_workers = max_workers or min(len(files), os.cpu_count() or 1)
+    
+    if max_workers <= 1 or len(files) == 1:
+        for index, (name, source) in enumerate(files):
+            yield _read_one(reader_class, reader_kwargs, index, name, source)
+        return
+    
+    with process_pool(max_workers) as executor:
+        futures = {
+            executor.submit(_read_one, reader_class, reader_kwargs, index, name, source, True): (index, name)
+            for index, (name, source) in enumerate(files)
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                index, name = futures[future]
+                yield BatchResult(name, None, str(e), index)
+
+
+def unique_labels(names: list[str]) -> list[str]:
+    """Make file names usable as labels: repeated names get ' (2)', ' (3)'...
+    
+    Args:
+        names: File names, possibly repeated (e.g. every depot sends 'bdv.xlsx')
+    
+    Returns:
+        One distinct label per name, in the same order
+    """
+    labels: list[str] = []
+    used: set[str] = set()
+    for name in names:
+        label, number = name, 1
+        while label in used:
+            number += 1
+            label = f"{name} ({number})"
+        used.add(label)
+        labels.append(label)
+    return labels
+
+
+def combine_results(results: list[BatchResult]) -> pd.DataFrame | None:
+    """Concatenate successful results in submission order, adding a source-file column.
+    
+    Files are told apart by their position, so uploads with the same name
+    are all kept; their labels in the source-file column are made distinct
+    (see `unique_labels`).
+    
+    Args:
+        results: Results from `read_files_parallel`, in any order
+    
+    Returns:
+        Combined DataFrame, or None if no file was read
+    """
+    results = sorted(results, key=lambda result: result.index)
+    labels = unique_labels([result.name for result in results])
+    frames = {label: result.df for label, result in zip(labels, results) if result.df is not None}
+    if not frames:
+        return None
+    return concat_labeled(frames, SOURCE_FILE_COLUMN)
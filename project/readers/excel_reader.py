@@ -1,29 +1,218 @@
+import fnmatch
+import os
+import re
 import pandas as pd
+from io import BytesIO
+from typing import Any, Iterator
 from project.readers.base_reader import BaseReader
+from project.readers.schema import split_schema, apply_schema, cast_categories
+from project.utils.hashing import read_file_bytes
+from project.utils.memory import concat_labeled
+from project.utils.pools import process_pool
+
+SHEET_COLUMN = 'Aba'
+
+# Workbook opened once per worker process by `_open_worker_workbook`
+_worker_workbook: pd.ExcelFile | None = None
+
+
+def _open_worker_workbook(content: bytes) -> None:
+    """Worker initializer: open the workbook once for every sheet this worker parses."""
+    global _worker_workbook
+    _worker_workbook = pd.ExcelFile(BytesIO(content), engine='openpyxl')
+
+
+def _parse_worker_sheet(sheet: str, options: dict[str, Any]) -> pd.DataFrame:
+    """Worker: parse one sheet of the already-open workbook. Must stay at module level to be picklable."""
+    return _worker_workbook.parse(sheet, **options)
+
+
+def match_sheets(sheet_names: list[str], pattern: str | None) -> list[str]:
+    """Filter sheet names with a case-insensitive glob pattern (e.g. 'Garagem*'), keeping workbook order."""
+    if pattern is None:
+        return list(sheet_names)
+    regex = re.compile(fnmatch.translate(pattern), re.IGNORECASE)
+    return [name for name in sheet_names if regex.match(name)]
 
 
 class ExcelReader(BaseReader):
     
-    def __init__(self, file_obj=None, sheet_name: int | str = 0, **kwargs):
+    DEFAULT_CHUNK_SIZE = 50_000
+    
+    def __init__(self, file_obj=None, sheet_name: int | str = 0, sheet_pattern: str | None = None, chunk_size: int = DEFAULT_CHUNK_SIZE, sheet_workers: int | None = None, **kwargs):
         super().__init__(file_obj, **kwargs)
         self.sheet_name = sheet_name
+        self.sheet_pattern = sheet_pattern
+        self.chunk_size = chunk_size
+        self.sheet_workers = sheet_workers
     
     def set_sheet_name(self, sheet_name: int | str):
         self.sheet_name = sheet_name
         return self
     
+    def set_sheet_pattern(self, sheet_pattern: str | None):
+        self.sheet_pattern = sheet_pattern
+        return self
+    
+    def set_chunk_size(self, chunk_size: int):
+        self.chunk_size = chunk_size
+        return self
+    
+    def set_sheet_workers(self, sheet_workers: int | None):
+        self.sheet_workers = sheet_workers
+        return self
+    
+    def get_cache_config(self) -> dict:
+        config = super().get_cache_config()
+        config['sheet_name'] = self.sheet_name
+        config['sheet_pattern'] = self.sheet_pattern
+        return config
+    
+    def _parse_options(self) -> dict[str, Any]:
+        options = {'header': self.header, 'skiprows': self.skiprows, 'dtype': self.dtype}
+        if self.schema:
+            usecols, dtype, converters = split_schema(self.schema)
+            options.update(usecols=usecols, dtype=dtype, converters=converters)
+        return {**options, **self.reader_config}
+    
     def read(self) -> None:
+        """Read the sheet into `self.df`.
+        
+        With a schema, only its columns are parsed (`usecols`) and they are
+        converted while parsing; `self.dtype` is then ignored. With a
+        `sheet_pattern`, every matching sheet is read (see `read_sheets`, with
+        `sheet_workers` processes) and the sheets are concatenated with their
+        name in the `Aba` column.
+        """
+        if self.sheet_pattern is not None:
+            frames = self.read_sheets(self.sheet_pattern, max_workers=self.sheet_workers)
+            if not frames:
+                raise ValueError(f"No sheet matches '{self.sheet_pattern}'")
+            self.df = concat_labeled(frames, SHEET_COLUMN)
+            return
+        
         try:
-            self.df = pd.read_excel(
-                self.file_obj,
-                sheet_name=self.sheet_name,
-                header=self.header,
-                skiprows=self.skiprows,
-                dtype=self.dtype,
-                **self.reader_config
-            )
+            df = pd.read_excel(self.file_obj, sheet_name=self.sheet_name, **self._parse_options())
         except Exception as e:
             raise ValueError(f"Error reading Excel file: {e}")
+        
+        self.df = cast_categories(df, self.schema) if self.schema else df
+    
+    def read_sheets(self, pattern: str | None = None, max_workers: int | None = None) -> dict[str, pd.DataFrame]:
+        """Read several sheets of the workbook, opening it once.
+        
+        Sheets are parsed in a process pool (openpyxl holds the GIL); each
+        worker opens the workbook once and parses every sheet it is given.
+        The header/skiprows/dtype/schema options apply to every sheet.
+        `self.df` is not populated.
+        
+        Args:
+            pattern: Case-insensitive glob on sheet names, e.g. 'Garagem*' (default: all sheets)
+            max_workers: Worker processes (default: one per CPU, at most one per sheet; 1 parses in this process)
+            
+        Returns:
+            Sheet name -> DataFrame, in workbook order
+            
+        Raises:
+            ValueError: If the workbook or a sheet cannot be read
+        """
+        content = read_file_bytes(self.file_obj)
+        options = self._parse_options()
+        
+        try:
+            with pd.ExcelFile(BytesIO(content), engine='openpyxl') as workbook:
+                sheets = match_sheets(workbook.sheet_names, pattern)
+                max_workers = max_workers or min(len(sheets), os.cpu_count() or 1)
+                
+                if max_workers <= 1 or len(sheets) <= 1:
+                    frames = {sheet: workbook.parse(sheet, **options) for sheet in sheets}
+                else:
+                    with process_pool(max_workers, initializer=_open_worker_workbook, initargs=(content,)) as executor:
+                        futures = {sheet: executor.submit(_parse_worker_sheet, sheet, options) for sheet in sheets}
+                        frames = {sheet: future.result() for sheet, future in futures.items()}
+        except Exception as e:
+            raise ValueError(f"Error reading Excel file: {e}")
+        
+        if self.schema:
+            frames = {sheet: cast_categories(df, self.schema) for sheet, df in frames.items()}
+        return frames
+    
+    def read_chunks(self, chunk_size: int | None = None) -> Iterator[pd.DataFrame]:
+        """Stream the sheet as DataFrame chunks using openpyxl read-only mode.
+        
+        Only one chunk of rows is held in memory at a time, so peak memory does
+        not grow with the workbook size. `self.df` is not populated. Only the
+        header/skiprows/dtype/schema options are applied (extra `read_excel` options
+        in `reader_config` and `sheet_pattern` are ignored). Fully empty rows are skipped.
+        
+        Args:
+            chunk_size: Rows per chunk (default: `self.chunk_size`)
+        
+        Yields:
+            DataFrame chunks with the header row as columns
+        """
+        from openpyxl import load_workbook
+        
+        chunk_size = chunk_size or self.chunk_size
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        
+        try:
+            workbook = load_workbook(self.file_obj, read_only=True, data_only=True)
+        except Exception as e:
+            raise ValueError(f"Error reading Excel file: {e}")
+        
+        try:
+            if isinstance(self.sheet_name, int):
+                worksheet = workbook.worksheets[self.sheet_name]
+            else:
+                worksheet = workbook[self.sheet_name]
+            
+            rows = worksheet.iter_rows(min_row=self.skiprows + self.header + 1, values_only=True)
+            header = next(rows, None)
+            if header is None:
+                return
+            columns = [str(name) if name is not None else f"Unnamed: {i}" for i, name in enumerate(header)]
+            
+            buffer: list[tuple] = []
+            for row in rows:
+                if all(value is None for value in row):
+                    continue
+                buffer.append(row)
+                if len(buffer) >= chunk_size:
+                    yield self._build_chunk(buffer, columns)
+                    buffer = []
+            
+            if buffer:
+                yield self._build_chunk(buffer, columns)
+        finally:
+            workbook.close()
+    
+    def _build_chunk(self, rows: list[tuple], columns: list[str]) -> pd.DataFrame:
+        """Build one chunk applying the reader dtype the same way `read_excel` does."""
+        width = len(columns)
+        # Integer-valued floats are kept as ints, like pandas' openpyxl engine
+        records = [
+            [int(v) if isinstance(v, float) and v.is_integer() else v for v in row[:width]]
+            + [None] * (width - len(row))
+            for row in rows
+        ]
+        chunk = pd.DataFrame(records, columns=columns, dtype=object)
+        
+        if self.schema:
+            return apply_schema(chunk.infer_objects(), self.schema)
+        
+        if self.dtype is None:
+            chunk = chunk.infer_objects()
+        elif self.dtype is str:
+            chunk = chunk.astype(str).where(chunk.notna())
+        elif isinstance(self.dtype, dict):
+            dtypes = {column: dtype for column, dtype in self.dtype.items() if column in chunk.columns}
+            chunk = chunk.infer_objects().astype(dtypes)
+        else:
+            chunk = chunk.astype(self.dtype)
+        
+        return chunk
     
     def validate(self) -> bool:
         if self.df is None:
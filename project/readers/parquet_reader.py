@@ -0,0 +1,58 @@
+import pandas as pd
+from typing import Iterator
+from project.readers.base_reader import BaseReader
+from project.readers.schema import apply_schema
+
+
+class ParquetReader(BaseReader):
+    
+    # Parquet is already a fast columnar format, re-caching it would only duplicate it
+    cacheable = False
+    
+    DEFAULT_CHUNK_SIZE = 100_000
+    
+    def __init__(self, file_obj=None, chunk_size: int = DEFAULT_CHUNK_SIZE, **kwargs):
+        super().__init__(file_obj, **kwargs)
+        self.chunk_size = chunk_size
+    
+    def _columns(self) -> list[str] | None:
+        return list(self.schema) if self.schema else None
+    
+    def read(self) -> None:
+        """Read the file into `self.df`, loading only the schema columns.
+        
+        Paths are memory-mapped. Parquet columns are already typed, so
+        `dtype`/`header`/`skiprows` do not apply; the schema is still enforced.
+        """
+        import pyarrow.parquet as pq
+        
+        try:
+            table = pq.read_table(self.file_obj, columns=self._columns(), memory_map=True)
+        except Exception as e:
+            raise ValueError(f"Error reading Parquet file: {e}")
+        
+        df = table.to_pandas()
+        self.df = apply_schema(df, self.schema) if self.schema else df
+    
+    def read_chunks(self, chunk_size: int | None = None) -> Iterator[pd.DataFrame]:
+        """Stream the file as record batches converted to DataFrames.
+        
+        Args:
+            chunk_size: Rows per chunk (default: `self.chunk_size`)
+            
+        Yields:
+            DataFrame chunks
+        """
+        import pyarrow.parquet as pq
+        
+        try:
+            parquet_file = pq.ParquetFile(self.file_obj, memory_map=True)
+        except Exception as e:
+            raise ValueError(f"Error reading Parquet file: {e}")
+        
+        for batch in parquet_file.iter_batches(batch_size=chunk_size or self.chunk_size, columns=self._columns()):
+            df = batch.to_pandas()
+            yield apply_schema(df, self.schema) if self.schema else df
+    
+    def validate(self) -> bool:
+        return self.df is not None and not self.df.empty
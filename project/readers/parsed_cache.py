@@ -0,0 +1,129 @@
+"""
+Persistent, content-addressed cache of parsed workbooks.
+
+Parsed DataFrames are stored as Parquet files named after the hash of the
+source file plus the reader configuration, so the same upload parsed with the
+same options is loaded from disk instead of being parsed again by openpyxl.
+Least recently used entries are evicted when the cache exceeds its size budget.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from project.utils.hashing import get_config_hash
+
+DEFAULT_CACHE_DIR = os.environ.get("SMARTTOOLS_CACHE_DIR", os.path.join("cache", "parsed"))
+DEFAULT_MAX_BYTES = int(os.environ.get("SMARTTOOLS_CACHE_MAX_BYTES", 1024 ** 3))
+
+CACHE_SUFFIX = ".parquet"
+
+
+class ParsedFrameCache:
+    
+    def __init__(self, cache_dir: str | Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+    
+    def make_key(self, file_hash: str, config: dict[str, Any]) -> str:
+        """Build the cache key for a source file hash and reader configuration.
+        
+        Args:
+            file_hash: Hash of the source file content
+            config: Reader configuration (header, sheet, dtype, columns...)
+            
+        Returns:
+            Cache key (safe to use as a file name)
+        """
+        return f"{file_hash[:32]}_{get_config_hash(config)[:16]}"
+    
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_SUFFIX}"
+    
+    def get(self, key: str) -> pd.DataFrame | None:
+        """Load a cached frame and mark it as recently used.
+        
+        Args:
+            key: Cache key from `make_key`
+            
+        Returns:
+            Cached DataFrame, or None on a miss or unreadable entry
+        """
+        path = self._path(key)
+        try:
+            df = pd.read_parquet(path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"⚠️ Discarding unreadable cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        
+        os.utime(path)
+        return df
+    
+    def put(self, key: str, df: pd.DataFrame) -> bool:
+        """Store a frame, then evict old entries if the size budget is exceeded.
+        
+        Frames that cannot be represented in Parquet (e.g. mixed-type object
+        columns or non-string column names) are simply not cached.
+        
+        Args:
+            key: Cache key from `make_key`
+            df: Parsed DataFrame
+            
+        Returns:
+            True if the frame was stored
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            try:
+                df.to_parquet(tmp_name, index=False)
+                os.replace(tmp_name, self._path(key))
+            finally:
+                if os.path.exists(tmp_name):
+                    os.remove(tmp_name)
+        except Exception as e:
+            print(f"⚠️ Could not cache parsed file: {e}")
+            return False
+        
+        self.evict()
+        return True
+    
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in `max_bytes`."""
+        entries = []
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+    
+    def clear(self) -> None:
+        """Remove every cached entry."""
+        for path in self.cache_dir.glob(f"*{CACHE_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+
+_default_cache: ParsedFrameCache | None = None
+
+
+def get_default_cache() -> ParsedFrameCache:
+    """Return the process-wide cache configured by SMARTTOOLS_CACHE_DIR / SMARTTOOLS_CACHE_MAX_BYTES."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ParsedFrameCache()
+    return _default_cache
@@ -0,0 +1,58 @@
+from pathlib import Path
+from project.readers.base_reader import BaseReader
+from project.readers.excel_reader import ExcelReader
+from project.readers.csv_reader import CsvReader
+from project.readers.parquet_reader import ParquetReader
+from project.readers.arrow_reader import ArrowReader
+
+
+class ReaderFactory:
+    
+    _readers: dict[str, type[BaseReader]] = {
+        'xlsx': ExcelReader,
+        'xls': ExcelReader,
+        'csv': CsvReader,
+        'parquet': ParquetReader,
+        'arrow': ArrowReader,
+        'feather': ArrowReader,
+    }
+    
+    @classmethod
+    def get_reader_class(cls, file_name: str, default: type[BaseReader] | None = None) -> type[BaseReader]:
+        """Return the reader for a file name based on its extension.
+        
+        Raises:
+            ValueError: If the extension is unknown and no default is given
+        """
+        extension = Path(file_name).suffix.lstrip('.').lower()
+        reader_class = cls._readers.get(extension, default)
+        if reader_class is None:
+            raise ValueError(f"Unsupported file type: .{extension}")
+        return reader_class
+    
+    @classmethod
+    def create_reader(cls, file_name: str, default: type[BaseReader] | None = None, format_options: dict[type[BaseReader], dict] | None = None, **kwargs) -> BaseReader:
+        """Create the reader for a file name with the options of its format.
+        
+        Args:
+            file_name: Name of the file (its extension selects the reader)
+            default: Reader for unknown extensions
+            format_options: Extra options per reader class, applied only to files of that format
+                (e.g. `{ExcelReader: {'header': 2}}` for the title rows of Excel exports)
+            **kwargs: Options for every format (file_obj, schema, cache...)
+        
+        Raises:
+            ValueError: If the extension is unknown and no default is given
+        """
+        reader_class = cls.get_reader_class(file_name, default=default)
+        options = (format_options or {}).get(reader_class, {})
+        return reader_class(**{**kwargs, **options})
+    
+    @classmethod
+    def get_file_types(cls) -> list[str]:
+        return list(cls._readers)
+    
+    @classmethod
+    def register_reader(cls, extension: str, reader_class: type[BaseReader]):
+        if issubclass(reader_class, BaseReader):
+            cls._readers[extension.lower()] = reader_class
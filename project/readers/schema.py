@@ -0,0 +1,99 @@
+"""
+Column schemas for readers.
+
+A schema maps each required column to its target type. Readers push it down
+to the parser (only these columns are read, already converted), so pages do
+not need a second conversion pass. A type of None keeps the parser's own
+inference for that column (e.g. Excel dates). 'category' stores a repeated
+text column as a categorical (one copy of each distinct value).
+
+Example:
+    {'Veículo': 'category', 'Data': str, 'Km Inicial': 'float', 'Km Final': 'float'}
+"""
+
+from typing import Any, Callable
+
+import pandas as pd
+
+Schema = dict[str, Any]
+
+CATEGORY = 'category'
+
+
+def to_float(value: Any) -> float:
+    """Cell converter: number or numeric text to float, anything else to NaN."""
+    if value is None or value == '':
+        return float('nan')
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float('nan')
+
+
+# Types that need coercion (invalid values become NaN) are converted cell by cell while parsing
+CONVERTERS: dict[Any, Callable[[Any], Any]] = {
+    'float': to_float,
+    float: to_float,
+}
+
+
+def split_schema(schema: Schema) -> tuple[list[str], dict[str, Any], dict[str, Callable[[Any], Any]]]:
+    """Split a schema into the `usecols`, `dtype` and `converters` options of the pandas readers.
+    
+    Args:
+        schema: Column name -> target type
+        
+    Returns:
+        Tuple (usecols, dtype, converters)
+    """
+    usecols = list(schema)
+    converters = {column: CONVERTERS[kind] for column, kind in schema.items() if kind in CONVERTERS}
+    # Categories are parsed as text and converted by `cast_categories`, so values stay strings
+    dtype = {column: str if kind == CATEGORY else kind for column, kind in schema.items() if kind is not None and column not in converters}
+    return usecols, dtype, converters
+
+
+def cast_categories(df: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+    """Convert the schema's 'category' columns of a frame parsed with `split_schema` options, in place.
+    
+    Args:
+        df: Parsed DataFrame
+        schema: Column name -> target type
+        
+    Returns:
+        The same DataFrame, for chaining
+    """
+    for column, kind in schema.items():
+        if kind == CATEGORY and column in df.columns:
+            df[column] = df[column].astype(CATEGORY)
+    return df
+
+
+def apply_schema(df: pd.DataFrame, schema: Schema) -> pd.DataFrame:
+    """Project and convert an already-parsed frame (used when the parser cannot do it, e.g. chunks).
+    
+    Args:
+        df: Parsed DataFrame
+        schema: Column name -> target type
+        
+    Returns:
+        New DataFrame with only the schema columns, converted
+        
+    Raises:
+        ValueError: If a schema column is missing
+    """
+    missing = [column for column in schema if column not in df.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+    
+    df = df[list(schema)].copy()
+    for column, kind in schema.items():
+        if kind in CONVERTERS:
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype(float)
+        elif kind is str or kind == CATEGORY:
+            df[column] = df[column].astype(str).where(df[column].notna())
+            if kind == CATEGORY:
+                df[column] = df[column].astype(CATEGORY)
+        elif kind is not None:
+            df[column] = df[column].astype(kind)
+    return df
@@ -1,6 +1,8 @@
 import streamlit as st
 from project.tools.base_tool import BaseTool
 
+MAX_BULK_PASSWORDS = 5_000_000
+
 class Password_generator(BaseTool):
     
     def get_name(self):
@@ -27,41 +29,60 @@ class Password_generator(BaseTool):
                     #st.success(f"Generated Password: {password}")
                     st.code(password, language="text", width='content')
             
-    def _generate_password(self, length, uppercase, lowercase, numbers, symbols):
-        import random
-        import string
-        
-        # conservative set of symbols commonly accepted by sites
-        accepted_symbols = "!@#$%&*()-_+=[]<>?.,;:^"
-
-        base_password = ""
-        if uppercase:
-            base_password += random.choice(string.ascii_uppercase)
-        if lowercase:
-            base_password += random.choice(string.ascii_lowercase)
-        if numbers:
-            base_password += random.choice(string.digits)
-        if symbols:
-            base_password += random.choice(accepted_symbols)
+            with st.expander("📦 Bulk generation"):
+                self._render_bulk(length, uppercase, lowercase, numbers, symbols)
+    
+    def _render_bulk(self, length, uppercase, lowercase, numbers, symbols):
+        count = st.number_input("Number of passwords", min_value=1, max_value=MAX_BULK_PASSWORDS, value=1000, step=1000)
         
-        char_pool = ""
-        if uppercase:
-            char_pool += string.ascii_uppercase
-        if lowercase:
-            char_pool += string.ascii_lowercase
-        if numbers:
-            char_pool += string.digits
-        if symbols:
-            char_pool += accepted_symbols
+        if st.button("Generate Passwords"):
+            from project.tools.password_generator.bulk import generate_passwords
             
-        if not char_pool:
-            st.error("Please select at least one character type!")
-            return ""
+            try:
+                with st.spinner("⏳ Generating passwords..."):
+                    batch = generate_passwords(count, length, self._selected_classes(uppercase, lowercase, numbers, symbols))
+                    st.session_state['password_bulk'] = batch
+            except ValueError as e:
+                st.error(f"❌ {e}")
+                return
         
-        password = ''.join(list(base_password) + [random.choice(char_pool) for _ in range(length - len(base_password))])
-        password = list(password)
-        random.shuffle(password)
-        return ''.join(password)
+        if 'password_bulk' not in st.session_state:
+            return
         
+        batch = st.session_state['password_bulk']
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Passwords", f"{len(batch.codes):,}")
+        col2.metric("Throughput", f"{batch.throughput:,.0f}/s", help=f"Generated in {batch.seconds:.2f} s")
+        col3.metric("Entropy", f"{batch.entropy_bits:.1f} bits", help="Per password, counting only passwords that contain every selected character type.")
+        
+        st.code("\n".join(batch.to_list(limit=10)), language="text", width='content')
+        st.download_button(
+            label="📥 Download CSV",
+            # Built only when clicked, so reruns do not keep a CSV copy of the batch
+            data=batch.to_csv,
+            file_name="passwords.csv",
+            mime="text/csv",
+            key="password_bulk_download",
+            on_click="ignore"
+        )
+        st.caption(
+            "ℹ️ Import the CSV with the column set to **Text**. Passwords starting with "
+            "`=`, `+`, `-` or `@` are saved with a leading `'` so spreadsheets do not run "
+            "them as formulas; remove it before use."
+        )
+    
+    @staticmethod
+    def _selected_classes(uppercase, lowercase, numbers, symbols):
+        selected = {'uppercase': uppercase, 'lowercase': lowercase, 'numbers': numbers, 'symbols': symbols}
+        return [name for name, enabled in selected.items() if enabled]
+    
+    def _generate_password(self, length, uppercase, lowercase, numbers, symbols):
+        # Same secure generator as the bulk mode (os.urandom, unbiased sampling)
+        from project.tools.password_generator.bulk import generate_passwords
+        
+        classes = self._selected_classes(uppercase, lowercase, numbers, symbols)
+        if not classes:
+            st.error("Please select at least one character type!")
+            return ""
         
-        
\ No newline at end of file
+        return generate_passwords(1, length, classes).to_list()[0]
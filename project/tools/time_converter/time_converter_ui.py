@@ -1,6 +1,10 @@
 import streamlit as st
 from project.tools.base_tool import BaseTool
 
+TO_SECONDS = "HH:MM:SS → Seconds"
+TO_HHMMSS = "Seconds → HH:MM:SS"
+INVALID_COLUMN = "Invalid"
+
 class TimeConverter(BaseTool):
     def get_name(self) -> str:
         return "Time Converter"
@@ -10,7 +14,7 @@ class TimeConverter(BaseTool):
     
     def get_description(self) -> str:
         return "Convert time between HH:MM:SS format and total seconds."
-
+    
     def render(self):
         st.header("Convert HH:MM:SS to Seconds and Vice Versa ⏰")
         
@@ -27,7 +31,7 @@ class TimeConverter(BaseTool):
             )
             if time_input and time_input != "00:00:00":
                 self._convert_time_to_seconds(time_input)
-    
+        
         with col2:
             st.subheader("Seconds → HH:MM:SS")
             sec_input = st.number_input(
@@ -40,7 +44,96 @@ class TimeConverter(BaseTool):
                 hhmmss = self._convert_seconds_to_hhmmss(sec_input)
                 st.success(f"**{sec_input}** seconds = **{hhmmss}**")
         
-
+        with st.expander("📋 Bulk conversion"):
+            self._render_bulk()
+    
+    def _render_bulk(self):
+        direction = st.radio("Direction", [TO_SECONDS, TO_HHMMSS], horizontal=True, key="time_bulk_direction")
+        source = st.radio("Input", ["Paste values", "Upload file"], horizontal=True, key="time_bulk_source")
+        
+        values = None
+        input_key = None
+        if source == "Paste values":
+            text = st.text_area("Values (one per line):", placeholder="01:30:45\n27:00:00", height=150, key="time_bulk_text")
+            if text.strip():
+                values = [line for line in text.splitlines() if line.strip()]
+                input_key = (direction, text)
+        else:
+            uploaded_file = st.file_uploader("📁 Upload a file", type=['xlsx', 'csv'], key="time_bulk_file")
+            header = st.number_input("Header row:", min_value=0, value=0, step=1, key="time_bulk_header", help="Row with the column names (2 for BDV Consolidado reports)")
+            if uploaded_file:
+                file_key, df = self._read_uploaded(uploaded_file, header)
+                if df is not None:
+                    column = st.selectbox("Column:", list(df.columns), index=list(df.columns).index('Tempo') if 'Tempo' in df.columns else 0, key="time_bulk_column")
+                    values = df[column]
+                    input_key = (direction, file_key, column)
+        
+        # A result only belongs to the input it was converted from
+        stored = st.session_state.get('time_bulk_result')
+        if stored is not None and stored[0] != input_key:
+            del st.session_state['time_bulk_result']
+        
+        if st.button("Convert", disabled=values is None, key="time_bulk_convert"):
+            st.session_state['time_bulk_result'] = (input_key, self._convert_bulk(values, direction))
+        
+        stored = st.session_state.get('time_bulk_result')
+        if stored is None:
+            return
+        result = stored[1]
+        
+        from project.utils.streamlit.download_utils import render_download_buttons
+        from project.utils.streamlit.grid_utils import render_paginated_grid
+        
+        invalid = int(result[INVALID_COLUMN].sum())
+        col1, col2 = st.columns(2)
+        col1.metric("Converted", f"{len(result) - invalid:,}")
+        col2.metric("Invalid", f"{invalid:,}")
+        
+        render_paginated_grid(result, key="time_bulk_grid")
+        render_download_buttons(result, label="📥 Download", file_stem="time_conversion", key="time_bulk_download", sheet_name="Conversion", formats=['xlsx', 'csv'])
+    
+    def _read_uploaded(self, uploaded_file, header: int):
+        """Read the uploaded file once per content and header row.
+        
+        Returns:
+            Tuple (key of the parsed input, DataFrame or None when it cannot be read)
+        """
+        from project.readers.reader_factory import ReaderFactory
+        from project.utils.hashing import get_source_hash
+        
+        key = (get_source_hash(uploaded_file), header)
+        cached = st.session_state.get('time_bulk_upload')
+        if cached is not None and cached[0] == key:
+            return cached
+        
+        reader = ReaderFactory.create_reader(uploaded_file.name, file_obj=uploaded_file, header=header)
+        if not reader.safe_read() or reader.df is None or reader.df.empty:
+            st.session_state.pop('time_bulk_upload', None)
+            st.error("❌ Error reading file. Please check the format and try again.")
+            return key, None
+        
+        st.session_state['time_bulk_upload'] = (key, reader.df)
+        return key, reader.df
+    
+    def _convert_bulk(self, values, direction: str):
+        """Convert a whole column at once; invalid entries are kept and flagged."""
+        import pandas as pd
+        from project.utils.durations import parse_hhmmss, format_hhmmss
+        
+        series = pd.Series(values, dtype='string').reset_index(drop=True)
+        if direction == TO_SECONDS:
+            converted = parse_hhmmss(series)
+            column = "Seconds"
+        else:
+            converted = format_hhmmss(series)
+            column = "HH:MM:SS"
+        
+        return pd.DataFrame({
+            "Input": series,
+            column: converted,
+            INVALID_COLUMN: converted.isna().to_numpy(),
+        })
+    
     def _convert_time_to_seconds(self, time_str: str):
         try:
             parts = time_str.split(':')
@@ -59,7 +152,7 @@ class TimeConverter(BaseTool):
             st.success(f"**{time_str}** = **{total:}** seconds")
         except ValueError:
             st.error("❌ Invalid format. Use only numbers and ':' (HH:MM:SS)")
-        
+    
     def _convert_seconds_to_hhmmss(self, total_seconds: int) -> str:
         h = total_seconds // 3600
         m = (total_seconds % 3600) // 60
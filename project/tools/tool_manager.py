@@ -1,18 +1,59 @@
+import importlib
+from typing import NamedTuple
 from project.tools.base_tool import BaseTool
-from project.tools.time_converter.time_converter_ui import TimeConverter
-from project.tools.password_generator.password_generator import Password_generator
+
+
+class ToolEntry(NamedTuple):
+    """Tool metadata, available without importing the tool module."""
+    name: str
+    module: str
+    class_name: str
+    icon: str = "🔧"
+    description: str = ""
+
 
 class ToolRegister:
-    _tools: list[type[BaseTool]] = [
-        TimeConverter,
-        Password_generator
+    _tools: list[ToolEntry] = [
+        ToolEntry("Time Converter", "project.tools.time_converter.time_converter_ui", "TimeConverter", "⏰", "Convert time between HH:MM:SS format and total seconds."),
+        ToolEntry("Password Generator", "project.tools.password_generator.password_generator", "Password_generator", "🔐", "Generate strong passwords with customizable options."),
         ]
     
+    _loaded: dict[str, type[BaseTool]] = {}
+    
+    @classmethod
+    def get_entries(cls) -> list[ToolEntry]:
+        """Returns the metadata of every tool without importing them."""
+        return list(cls._tools)
+    
+    @classmethod
+    def get_tool_class(cls, name: str) -> type[BaseTool]:
+        """Imports (once) and returns the class of the tool with the given name."""
+        if name not in cls._loaded:
+            entry = next((entry for entry in cls._tools if entry.name == name), None)
+            if entry is None:
+                raise KeyError(f"Unknown tool: {name}")
+            module = importlib.import_module(entry.module)
+            cls._loaded[name] = getattr(module, entry.class_name)
+        return cls._loaded[name]
+    
+    @classmethod
+    def create_tool(cls, name: str) -> BaseTool:
+        return cls.get_tool_class(name)()
+    
     @classmethod
     def get_tools(cls) -> list[BaseTool]:
-        return [tool() for tool in cls._tools]
+        return [cls.create_tool(entry.name) for entry in cls._tools]
     
     @classmethod
-    def register_tool(cls, class_tool: type[BaseTool]):
-        if issubclass(class_tool, BaseTool) and class_tool not in cls._tools:
-            cls._tools.append(class_tool)
\ No newline at end of file
+    def register_tool(cls, class_tool: type[BaseTool] | ToolEntry):
+        if isinstance(class_tool, ToolEntry):
+            entry = class_tool
+        elif issubclass(class_tool, BaseTool):
+            instance = class_tool()
+            entry = ToolEntry(instance.get_name(), class_tool.__module__, class_tool.__name__, instance.get_icon(), instance.get_description())
+            cls._loaded[entry.name] = class_tool
+        else:
+            return
+        
+        if entry.name not in [tool.name for tool in cls._tools]:
+            cls._tools.append(entry)
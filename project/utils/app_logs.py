@@ -1,25 +1,161 @@
 """
 Sistema de logging simples e eficaz para SmartTools.
+
+As chamadas de log apenas colocam o registro em uma fila; uma thread de
+fundo (`QueueListener`) grava no console e em arquivos JSON Lines, então a
+thread do script Streamlit nunca espera por disco. Os arquivos giram por
+data e por tamanho.
 """
 
+import atexit
+import contextvars
+import copy
+import json
 import logging
+import os
+import queue
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from datetime import datetime
+from typing import Any
+
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 5
+
+_page_context: contextvars.ContextVar[str | None] = contextvars.ContextVar('log_page', default=None)
+
+
+def set_page_context(page: str | None) -> None:
+    """Define a página adicionada aos logs da thread atual (execução do script)."""
+    _page_context.set(page)
+
+
+def _get_session_id() -> str | None:
+    # Só consulta o Streamlit se ele já estiver carregado (a CLI não o importa)
+    if 'streamlit' not in sys.modules:
+        return None
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        return None
+    return ctx.session_id if ctx is not None else None
+
+
+class ContextFilter(logging.Filter):
+    """Anexa sessão e página ao registro, ainda na thread que fez a chamada."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.session_id = _get_session_id()
+        record.page = _page_context.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Formata cada registro como uma linha JSON."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).astimezone().isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'source': f"{record.filename}:{record.lineno}",
+            'message': record.getMessage(),
+        }
+        for key in ('session_id', 'page'):
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        entry.update(getattr(record, 'fields', None) or {})
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DailyRotatingFileHandler(RotatingFileHandler):
+    """Arquivo `<prefixo>_AAAAMMDD.log` que troca de arquivo na virada do dia
+    e gira por tamanho (`.1`, `.2`...) dentro do mesmo dia.
+    """
+    
+    def __init__(self, log_dir: str | Path, prefix: str, max_bytes: int = LOG_MAX_BYTES, backup_count: int = LOG_BACKUP_COUNT):
+        self.log_dir = Path(log_dir)
+        self.prefix = prefix
+        self.day = self._today()
+        super().__init__(self._path_for(self.day), maxBytes=max_bytes, backupCount=backup_count, encoding='utf-8', delay=True)
+    
+    @staticmethod
+    def _today() -> str:
+        return datetime.now().strftime('%Y%m%d')
+    
+    def _path_for(self, day: str) -> Path:
+        return self.log_dir / f"{self.prefix}_{day}.log"
+    
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        return self._today() != self.day or bool(super().shouldRollover(record))
+    
+    def doRollover(self) -> None:
+        today = self._today()
+        if today == self.day:
+            super().doRollover()
+            return
+        
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        self.day = today
+        self.baseFilename = os.path.abspath(self._path_for(today))
+
+
+class JsonQueueHandler(QueueHandler):
+    """QueueHandler que mantém o traceback separado da mensagem.
+    
+    O `prepare` padrão junta o traceback à mensagem e limpa `exc_info` e
+    `exc_text`, então o JsonFormatter nunca veria a exceção. Aqui a mensagem
+    é resolvida e o traceback vai para `exc_text`, que os formatadores usam.
+    """
+    
+    _exc_formatter = logging.Formatter()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self._exc_formatter.formatException(record.exc_info)
+        record.msg = record.getMessage()
+        record.message = record.msg
+        record.args = None
+        # O traceback mantém frames vivos; o texto já basta
+        record.exc_info = None
+        return record
+
+
+def _stop_listener(listener: QueueListener) -> None:
+    if listener._thread is not None:
+        listener.stop()
 
 
 def setup_logger(
     name: str = "smarttools",
     level: int = logging.INFO,
-    log_dir: str = "logs"
+    log_dir: str = "logs",
+    max_bytes: int = LOG_MAX_BYTES,
+    backup_count: int = LOG_BACKUP_COUNT,
+    console: bool = True
 ) -> logging.Logger:
     """
-    Configura logger com arquivo rotativo por data.
+    Configura logger assíncrono: console em texto e arquivo JSON Lines
+    rotativo por data e tamanho, gravados por uma thread de fundo.
     
     Args:
         name: Nome do logger
         level: Nível de log (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_dir: Diretório para salvar logs
-        
+        max_bytes: Tamanho máximo de cada arquivo antes de girar
+        backup_count: Quantidade de arquivos girados mantidos por dia
+        console: Também escreve no console
+    
     Returns:
         Logger configurado
     """
@@ -29,31 +165,45 @@ def setup_logger(
         return logger
     
     logger.setLevel(level)
+    logger.propagate = False
     
     formatter = logging.Formatter(
         fmt='%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(level)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: list[logging.Handler] = []
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(level)
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
     
+    file_error = None
     try:
-        log_path = Path(log_dir)
-        log_path.mkdir(exist_ok=True)
+        Path(log_dir).mkdir(parents=True, exist_ok=True)
         
-        log_filename = f"smarttools_{datetime.now().strftime('%Y%m%d')}.log"
-        file_path = log_path / log_filename
-        
-        file_handler = logging.FileHandler(file_path, encoding='utf-8')
+        file_handler = DailyRotatingFileHandler(log_dir, name, max_bytes=max_bytes, backup_count=backup_count)
         file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
-        
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    
     except Exception as e:
-        logger.warning(f"Não foi possível criar arquivo de log: {e}")
+        file_error = e
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = JsonQueueHandler(log_queue)
+    queue_handler.addFilter(ContextFilter())
+    logger.addHandler(queue_handler)
+    
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    queue_handler.listener = listener
+    # Grava o que ainda estiver na fila ao encerrar
+    atexit.register(_stop_listener, listener)
+    
+    if file_error is not None:
+        logger.warning(f"Não foi possível criar arquivo de log: {file_error}")
     
     return logger
 
@@ -61,21 +211,23 @@ def setup_logger(
 app_logger = setup_logger()
 
 
-def info(msg: str):
-    """Log informativo."""
-    app_logger.info(msg)
+def info(msg: str, stacklevel: int = 1, **fields: Any):
+    """Log informativo. Campos extras vão para a linha JSON; `stacklevel` > 1
+    atribui a linha a quem chamou o chamador (para helpers que logam por ele).
+    """
+    app_logger.info(msg, extra={'fields': fields}, stacklevel=stacklevel + 1)
 
 
-def warning(msg: str):
+def warning(msg: str, stacklevel: int = 1, **fields: Any):
     """Log de aviso."""
-    app_logger.warning(msg)
+    app_logger.warning(msg, extra={'fields': fields}, stacklevel=stacklevel + 1)
 
 
-def error(msg: str):
+def error(msg: str, stacklevel: int = 1, **fields: Any):
     """Log de erro."""
-    app_logger.error(msg)
+    app_logger.error(msg, extra={'fields': fields}, stacklevel=stacklevel + 1)
 
 
-def exception(msg: str):
+def exception(msg: str, stacklevel: int = 1, **fields: Any):
     """Log de exceção com stack trace."""
-    app_logger.exception(msg)
\ No newline at end of file
+    app_logger.exception(msg, extra={'fields': fields}, stacklevel=stacklevel + 1)
@@ -0,0 +1,64 @@
+"""
+Vectorized helpers for HH:MM:SS durations.
+
+Shared by the reader pages and tools that need to turn whole columns of
+'Tempo' / 'Hora Saída' / 'Hora Chegada' strings into seconds.
+"""
+
+import pandas as pd
+
+# Hours are unbounded so durations over 24h are accepted; minutes/seconds must be 00-59
+HHMMSS_PATTERN = r'^\s*(\d+):([0-5]\d):([0-5]\d)\s*$'
+
+
+def parse_hhmmss(values: pd.Series | list[str]) -> pd.Series:
+    """Convert HH:MM:SS strings to total seconds in a single vectorized pass.
+    
+    Args:
+        values: Series (or list) of duration strings
+        
+    Returns:
+        Nullable Int64 Series with total seconds, <NA> for malformed values
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    parts = series.astype('string').str.extract(HHMMSS_PATTERN)
+    
+    seconds = (
+        pd.to_numeric(parts[0]) * 3600
+        + pd.to_numeric(parts[1]) * 60
+        + pd.to_numeric(parts[2])
+    )
+    return seconds.astype('Int64')
+
+
+def parse_seconds(values: pd.Series | list) -> pd.Series:
+    """Convert numbers or numeric strings to whole seconds.
+    
+    Args:
+        values: Series (or list) of second counts
+        
+    Returns:
+        Nullable Int64 Series, <NA> for non-numeric, negative or fractional values
+    """
+    series = values if isinstance(values, pd.Series) else pd.Series(values)
+    if not pd.api.types.is_numeric_dtype(series):
+        series = series.astype('string').str.strip()
+    numbers = pd.to_numeric(series, errors='coerce').astype('Float64')
+    valid = (numbers >= 0) & (numbers % 1 == 0)
+    return numbers.where(valid.fillna(False)).astype('Int64')
+
+
+def format_hhmmss(seconds: pd.Series | list) -> pd.Series:
+    """Format second counts as HH:MM:SS, with hours going past 24 (e.g. 90000 -> '25:00:00').
+    
+    Args:
+        seconds: Series (or list) of non-negative whole seconds
+        
+    Returns:
+        String Series, <NA> where the input is missing
+    """
+    seconds = parse_seconds(seconds)
+    hours = (seconds // 3600).astype('string').str.zfill(2)
+    minutes = (seconds % 3600 // 60).astype('string').str.zfill(2)
+    secs = (seconds % 60).astype('string').str.zfill(2)
+    return hours + ':' + minutes + ':' + secs
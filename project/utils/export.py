@@ -0,0 +1,134 @@
+"""
+Export helpers shared by the reader pages and the command line.
+
+Excel files are written with xlsxwriter; sheets above `CONSTANT_MEMORY_ROWS`
+are streamed row by row in constant_memory mode so big exports do not keep
+the whole workbook in RAM. Generated files are cached by result hash in a
+byte-budgeted LRU cache, so downloading the same result twice does not
+rebuild it.
+"""
+
+import hashlib
+import os
+from io import BytesIO
+from pathlib import Path
+from typing import IO
+
+import pandas as pd
+
+from project.utils.perf import StageTimer
+from project.utils.result_cache import ResultCache
+
+EXPORT_FORMATS = ['xlsx', 'csv', 'parquet']
+
+MIME_TYPES = {
+    'xlsx': "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    'csv': "text/csv",
+    'parquet': "application/vnd.apache.parquet",
+}
+
+EXCEL_MAX_ROWS = 1_048_576
+CONSTANT_MEMORY_ROWS = 50_000
+
+EXPORT_CACHE_MAX_BYTES = int(os.environ.get("SMARTTOOLS_EXPORT_CACHE_MAX_BYTES", 128 * 1024 ** 2))
+
+
+def _write_excel_streaming(df: pd.DataFrame, target: str | Path | IO[bytes], sheet_name: str) -> None:
+    """Write a sheet row by row with xlsxwriter constant_memory mode.
+    
+    pandas' `to_excel` writes cells column by column, which constant_memory
+    mode does not support, so rows are written directly here.
+    """
+    import xlsxwriter
+    
+    workbook = xlsxwriter.Workbook(target, {
+        'constant_memory': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+        'strings_to_numbers': False,
+    })
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, [str(column) for column in df.columns])
+        
+        values = df.astype(object).where(df.notna(), None)
+        for row_number, row in enumerate(values.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_number, 0, row)
+    finally:
+        workbook.close()
+
+
+def write_frame(df: pd.DataFrame, target: str | Path | IO[bytes], fmt: str | None = None, sheet_name: str = "Sheet1") -> None:
+    """Write a DataFrame as Excel, CSV or Parquet.
+    
+    Args:
+        df: DataFrame to export
+        target: Output path or binary buffer
+        fmt: 'xlsx', 'csv' or 'parquet' (default: taken from the path suffix)
+        sheet_name: Sheet name for Excel output
+    
+    Raises:
+        ValueError: If the format is unknown or the frame does not fit in an Excel sheet
+    """
+    if fmt is None:
+        fmt = Path(target).suffix.lstrip('.').lower() if isinstance(target, (str, Path)) else 'xlsx'
+    
+    if fmt == 'xlsx':
+        if len(df) + 1 > EXCEL_MAX_ROWS:
+            raise ValueError(f"{len(df):,} rows do not fit in an Excel sheet, use CSV or Parquet")
+        if len(df) > CONSTANT_MEMORY_ROWS:
+            _write_excel_streaming(df, target, sheet_name)
+        else:
+            with pd.ExcelWriter(target, engine='xlsxwriter') as writer:
+                df.to_excel(writer, index=False, sheet_name=sheet_name)
+    elif fmt == 'csv':
+        df.to_csv(target, index=False, encoding='utf-8')
+    elif fmt == 'parquet':
+        df.to_parquet(target, index=False)
+    else:
+        raise ValueError(f"Unsupported export format: {fmt} (use one of {', '.join(EXPORT_FORMATS)})")
+
+
+def get_frame_hash(df: pd.DataFrame) -> str:
+    """Hash a DataFrame's content and column names (vectorized, no pickling).
+    
+    Args:
+        df: DataFrame to hash
+    
+    Returns:
+        SHA256 hash string
+    """
+    hasher = hashlib.sha256()
+    hasher.update(repr(list(df.columns)).encode('utf-8'))
+    hasher.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return hasher.hexdigest()
+
+
+_export_cache = ResultCache(max_bytes=EXPORT_CACHE_MAX_BYTES)
+_export_timer = StageTimer(keep_spans=False, page='export')
+
+
+def _write_bytes(df: pd.DataFrame, fmt: str, sheet_name: str) -> bytes:
+    buffer = BytesIO()
+    write_frame(df, buffer, fmt, sheet_name=sheet_name)
+    return buffer.getvalue()
+
+
+def export_bytes(df: pd.DataFrame, fmt: str, sheet_name: str = "Sheet1") -> bytes:
+    """Return the exported file as bytes, reusing a previous export of the same result.
+    
+    Files are kept while they fit in `EXPORT_CACHE_MAX_BYTES`
+    (SMARTTOOLS_EXPORT_CACHE_MAX_BYTES), least recently used first out.
+    
+    Args:
+        df: DataFrame to export
+        fmt: 'xlsx', 'csv' or 'parquet'
+        sheet_name: Sheet name for Excel output
+    
+    Returns:
+        File content
+    """
+    with _export_timer.span('export', fmt=fmt, rows=len(df)) as span:
+        key = (get_frame_hash(df), fmt, sheet_name)
+        content, span['cached'] = _export_cache.get_or_compute(key, lambda: _write_bytes(df, fmt, sheet_name))
+        span['output_bytes'] = len(content)
+    return content
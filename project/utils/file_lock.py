@@ -0,0 +1,68 @@
+"""
+Inter-process lock on a file, for state shared by several server processes.
+
+Uses `fcntl.flock` on POSIX and `msvcrt.locking` on Windows. The operating
+system releases the lock when the file is closed, including when the
+process holding it dies, so a crash never leaves the state locked.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterator
+
+POLL_SECONDS = 0.05
+
+if os.name == 'nt':
+    import msvcrt
+    
+    def _try_lock(handle: IO[bytes]) -> bool:
+        handle.seek(0)
+        try:
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            return False
+        return True
+    
+    def _unlock(handle: IO[bytes]) -> None:
+        handle.seek(0)
+        msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+else:
+    import fcntl
+    
+    def _try_lock(handle: IO[bytes]) -> bool:
+        try:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return False
+        return True
+    
+    def _unlock(handle: IO[bytes]) -> None:
+        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: str | Path, timeout: float | None = None) -> Iterator[None]:
+    """Hold an exclusive lock on `path` (created if missing) while the block runs.
+    
+    Args:
+        path: Lock file, next to the data it protects
+        timeout: Seconds to wait for another holder (default: wait as long as needed)
+    
+    Raises:
+        TimeoutError: If the lock is still held by someone else after `timeout`
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    deadline = None if timeout is None else time.monotonic() + timeout
+    
+    with open(path, 'a+b') as handle:
+        while not _try_lock(handle):
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"Could not lock {path} within {timeout} s")
+            time.sleep(POLL_SECONDS)
+        try:
+            yield
+        finally:
+            _unlock(handle)
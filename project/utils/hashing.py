@@ -0,0 +1,136 @@
+"""
+Content hashing helpers used to build cache keys.
+
+Kept free of Streamlit imports so readers and headless jobs can use them.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# Read size when hashing files from disk
+HASH_CHUNK_BYTES = 4 * 1024 * 1024
+
+# Number of source hashes remembered by file identity (upload id, or path + size + mtime)
+SOURCE_HASH_CACHE_SIZE = 256
+
+_source_hashes: OrderedDict[tuple, str] = OrderedDict()
+_source_hashes_lock = threading.Lock()
+
+
+def get_file_hash(file_bytes: bytes) -> str:
+    """Generate hash for file content to use as cache key.
+    
+    Args:
+        file_bytes: File content as bytes
+    
+    Returns:
+        SHA256 hash string
+    """
+    return hashlib.sha256(file_bytes).hexdigest()
+
+
+def _source_identity(file_obj: Any) -> tuple | None:
+    """Identity of a source that cannot change without changing identity, or None."""
+    if isinstance(file_obj, str) or hasattr(file_obj, '__fspath__'):
+        stat = os.stat(file_obj)
+        return ('path', os.path.abspath(file_obj), stat.st_size, stat.st_mtime_ns)
+    # Streamlit gives every upload a new id, and UploadedFile content is never rewritten
+    file_id = getattr(file_obj, 'file_id', None)
+    if file_id is not None:
+        return ('upload', file_id, getattr(file_obj, 'size', None))
+    return None
+
+
+def _hash_stream(file_obj: Any) -> str:
+    if isinstance(file_obj, (bytes, bytearray, memoryview)):
+        return hashlib.sha256(file_obj).hexdigest()
+    
+    if isinstance(file_obj, str) or hasattr(file_obj, '__fspath__'):
+        with open(file_obj, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+    
+    if hasattr(file_obj, 'getvalue'):
+        # BytesIO (and Streamlit uploads) return the bytes they were created from, without copying
+        return hashlib.sha256(file_obj.getvalue()).hexdigest()
+    
+    digest = hashlib.sha256()
+    position = file_obj.tell()
+    file_obj.seek(0)
+    while chunk := file_obj.read(HASH_CHUNK_BYTES):
+        digest.update(chunk)
+    file_obj.seek(position)
+    return digest.hexdigest()
+
+
+def get_source_hash(file_obj: Any) -> str:
+    """Hash of a file's content, streamed and remembered by file identity.
+    
+    Gives the same value as `get_file_hash(read_file_bytes(file_obj))`, but
+    the content is never copied, and uploads and unchanged files on disk are
+    only hashed once: later calls are a dictionary lookup.
+    
+    Args:
+        file_obj: File path, raw bytes, Streamlit UploadedFile or any binary file-like object
+    
+    Returns:
+        SHA256 hash string
+    """
+    identity = _source_identity(file_obj)
+    if identity is not None:
+        with _source_hashes_lock:
+            file_hash = _source_hashes.get(identity)
+            if file_hash is not None:
+                _source_hashes.move_to_end(identity)
+                return file_hash
+    
+    file_hash = _hash_stream(file_obj)
+    
+    if identity is not None:
+        with _source_hashes_lock:
+            _source_hashes[identity] = file_hash
+            while len(_source_hashes) > SOURCE_HASH_CACHE_SIZE:
+                _source_hashes.popitem(last=False)
+    return file_hash
+
+
+def read_file_bytes(file_obj: Any) -> bytes:
+    """Return the full content of a path, bytes or file-like object without moving its cursor.
+    
+    Args:
+        file_obj: File path, raw bytes, Streamlit UploadedFile or any binary file-like object
+    
+    Returns:
+        File content as bytes
+    """
+    if isinstance(file_obj, (bytes, bytearray)):
+        return bytes(file_obj)
+    
+    if isinstance(file_obj, str) or hasattr(file_obj, '__fspath__'):
+        with open(file_obj, 'rb') as f:
+            return f.read()
+    
+    if hasattr(file_obj, 'getvalue'):
+        return file_obj.getvalue()
+    
+    position = file_obj.tell()
+    file_obj.seek(0)
+    content = file_obj.read()
+    file_obj.seek(position)
+    return content
+
+
+def get_config_hash(config: dict[str, Any]) -> str:
+    """Generate a stable hash for a reader/operation configuration.
+    
+    Args:
+        config: JSON-like configuration (non-serializable values use their repr)
+    
+    Returns:
+        SHA256 hash string
+    """
+    payload = json.dumps(config, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
@@ -0,0 +1,150 @@
+"""
+Lineage-based cache keys for derived DataFrames.
+
+A frame's lineage is where it comes from: the hash of the source file and
+the chain of operations (with their parameters) applied to it. Lineages are
+small tuples, so building and looking up a key costs microseconds whatever
+the size of the frame, unlike hashing its content.
+
+Frames are tagged with their lineage when a page stage produces them, and
+functions decorated with `cached_by_lineage` key their results by the
+lineage of their input plus their own name and parameters, storing them in
+the shared result cache. Their results are tagged too, so chains of cached
+operations (filter, then sort...) stay cheap.
+"""
+
+import functools
+import inspect
+import threading
+import weakref
+from typing import Any, Callable, Hashable, NamedTuple
+
+import pandas as pd
+
+from project.utils.result_cache import get_result_cache
+
+
+class Lineage(NamedTuple):
+    source: str
+    steps: tuple[tuple[str, tuple[tuple[str, Hashable], ...]], ...] = ()
+    
+    @classmethod
+    def from_source(cls, file_hash: str, *config: Hashable) -> 'Lineage':
+        """Lineage of a frame read from a file (config: reader options it depends on)."""
+        return cls(file_hash).then('source', config=config) if config else cls(file_hash)
+    
+    def then(self, operation: str, **params: Any) -> 'Lineage':
+        """Lineage of the result of `operation` applied to this frame."""
+        step = (operation, tuple(sorted((name, _hashable(value)) for name, value in params.items())))
+        return Lineage(self.source, self.steps + (step,))
+    
+    @property
+    def operation(self) -> str | None:
+        """Name of the last operation (None for a source frame)."""
+        return self.steps[-1][0] if self.steps else None
+
+
+def _hashable(value: Any) -> Hashable:
+    """Key form of an operation parameter (lists become tuples, frames their lineage...)."""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return get_lineage(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((repr(key), _hashable(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(repr(item) for item in value))
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+_lineages: dict[int, Lineage] = {}
+_lineages_lock = threading.Lock()
+
+
+def _forget(frame_id: int) -> None:
+    with _lineages_lock:
+        _lineages.pop(frame_id, None)
+
+
+def tag_lineage(value: Any, lineage: Lineage) -> Any:
+    """Record the lineage of a frame, or of each frame of a tuple/list result.
+    
+    The lineage is kept by object identity (not in `DataFrame.attrs`, which
+    pandas copies to every derived frame) and forgotten when the frame is
+    garbage collected.
+    
+    Args:
+        value: Frame, or tuple/list of frames (items get the lineage plus their position)
+        lineage: Lineage of the value
+    
+    Returns:
+        The value, for chaining
+    """
+    if isinstance(value, pd.DataFrame):
+        frame_id = id(value)
+        with _lineages_lock:
+            known = frame_id in _lineages
+            _lineages[frame_id] = lineage
+        if not known:
+            weakref.finalize(value, _forget, frame_id)
+    elif isinstance(value, (tuple, list)):
+        for position, item in enumerate(value):
+            # Batch results carry their frame in `df`
+            if isinstance(item, tuple) and 'df' in getattr(item, '_fields', ()):
+                item = item.df
+            tag_lineage(item, lineage.then('item', position=position))
+    return value
+
+
+def get_lineage(frame: Any) -> Lineage | None:
+    """Return the lineage recorded for a frame, or None if it was never tagged."""
+    with _lineages_lock:
+        return _lineages.get(id(frame))
+
+
+def cached_by_lineage(operation: str | None = None, ignore: tuple[str, ...] = ()) -> Callable[[Callable], Callable]:
+    """Cache a function of a DataFrame in the shared result cache, keyed by lineage.
+    
+    The key is the lineage of the first argument plus the operation name and
+    the other arguments (frames among them are replaced by their lineage).
+    When a frame has no lineage the function simply runs, uncached. Results
+    are shared read-only views: do not mutate them.
+    
+    Args:
+        operation: Name used in the key (default: the function name)
+        ignore: Arguments left out of the key (e.g. a callable already identified by another argument)
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        name = operation or func.__name__
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            (_, frame), *params = bound.arguments.items()
+            
+            lineage = get_lineage(frame)
+            frames = [value for key, value in params if isinstance(value, (pd.DataFrame, pd.Series)) and key not in ignore]
+            if lineage is None or any(get_lineage(value) is None for value in frames):
+                return func(*args, **kwargs)
+            
+            key = lineage.then(name, **{key: value for key, value in params if key not in ignore})
+            value, _ = get_result_cache().get_or_compute(key, lambda: func(*args, **kwargs))
+            return tag_lineage(value, key)
+        
+        def clear() -> int:
+            """Remove the cached results of this function."""
+            return get_result_cache().discard(lambda key: isinstance(key, Lineage) and key.operation == name)
+        
+        wrapper.clear = clear
+        return wrapper
+    
+    return decorator
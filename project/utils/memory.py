@@ -0,0 +1,122 @@
+"""
+Memory-compact dtypes for loaded reports.
+
+Readers parse text with `dtype=str`, so every cell is a separate Python
+string. `compact_frame` converts repeated text to categoricals, numbers to
+the smallest lossless numeric type and date objects to datetime64, and
+`estimate_text_memory` tells how much the same frame would take as text,
+so the saving can be reported.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+# A text column becomes categorical when it has at most this many distinct values per row
+CATEGORY_MAX_RATIO = 0.5
+
+_POINTER_BYTES = np.dtype(object).itemsize
+
+
+def _compact_column(series: pd.Series, category_max_ratio: float) -> pd.Series:
+    if pd.api.types.is_bool_dtype(series) or isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    
+    if pd.api.types.is_integer_dtype(series) and not pd.api.types.is_extension_array_dtype(series):
+        return pd.to_numeric(series, downcast='integer')
+    
+    if pd.api.types.is_float_dtype(series) and not pd.api.types.is_extension_array_dtype(series):
+        narrow = series.astype(np.float32)
+        # Only when every value survives the round trip (e.g. integral km below 2**24)
+        if np.array_equal(narrow.to_numpy(dtype=np.float64), series.to_numpy(), equal_nan=True):
+            return narrow
+        return series
+    
+    if series.dtype != object:
+        return series
+    
+    values = series.dropna()
+    if values.empty:
+        return series
+    
+    kind = pd.api.types.infer_dtype(values, skipna=True)
+    if kind in ('datetime', 'datetime64', 'date'):
+        return pd.to_datetime(series, errors='coerce')
+    if kind == 'string' and values.nunique() <= category_max_ratio * len(series):
+        return series.astype('category')
+    return series
+
+
+def compact_frame(df: pd.DataFrame, category_max_ratio: float = CATEGORY_MAX_RATIO, exclude: list[str] | None = None) -> pd.DataFrame:
+    """Return a copy of the frame with memory-compact dtypes.
+    
+    Text that looks like numbers or dates is left as text: only values that
+    are already numbers or date objects are converted, so no ambiguous
+    parsing (e.g. dd/mm vs mm/dd) happens here.
+    
+    Args:
+        df: DataFrame to compact
+        category_max_ratio: Maximum distinct values per row for a text column to become categorical
+        exclude: Columns to keep as they are
+    
+    Returns:
+        New DataFrame with compact dtypes
+    """
+    exclude = set(exclude or [])
+    return pd.DataFrame({
+        column: df[column] if column in exclude else _compact_column(df[column], category_max_ratio)
+        for column in df.columns
+    }, index=df.index)
+
+
+def estimate_text_memory(df: pd.DataFrame) -> int:
+    """Estimate the bytes the frame would take with every column as Python strings (`dtype=str`).
+    
+    Categorical columns are expanded from the size of their categories, so the
+    estimate does not materialize the strings.
+    
+    Args:
+        df: DataFrame to measure
+    
+    Returns:
+        Estimated memory in bytes (index excluded)
+    """
+    total = 0
+    for column in df.columns:
+        series = df[column]
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            sizes = np.array([sys.getsizeof(str(value)) for value in series.cat.categories], dtype=np.int64)
+            codes = series.cat.codes.to_numpy()
+            total += int(sizes[codes[codes >= 0]].sum()) + _POINTER_BYTES * len(series)
+        elif series.dtype == object:
+            total += int(series.memory_usage(index=False, deep=True))
+        else:
+            total += int(series.astype(str).memory_usage(index=False, deep=True))
+    return total
+
+
+def concat_labeled(frames: dict[str, pd.DataFrame], label_column: str) -> pd.DataFrame:
+    """Concatenate frames, adding a categorical column with each frame's label.
+    
+    `pd.concat` falls back to object when the frames' categories differ, so
+    columns that are categorical in every frame are converted back.
+    
+    Args:
+        frames: Label (file or sheet name) -> DataFrame, in output order
+        label_column: Name of the label column
+        
+    Returns:
+        Combined DataFrame
+    """
+    labels = list(frames)
+    combined = pd.concat(
+        [df.assign(**{label_column: label}) for label, df in frames.items()],
+        ignore_index=True
+    )
+    
+    for column in frames[labels[0]].columns:
+        if all(isinstance(df[column].dtype, pd.CategoricalDtype) for df in frames.values() if column in df):
+            combined[column] = combined[column].astype('category')
+    combined[label_column] = pd.Categorical(combined[label_column], categories=labels)
+    return combined
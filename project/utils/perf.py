@@ -0,0 +1,72 @@
+"""
+Timing spans for pipeline stages.
+
+Each span records the stage name, its duration and any attached fields (row
+counts, byte sizes, cache hits). Finished spans are logged through app_logs,
+as one JSON line in the log file, and kept on the timer so a page can show
+the breakdown.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from project.utils import app_logs
+
+
+def count_rows(value: Any) -> int | None:
+    """Best-effort row count of a stage result.
+    
+    DataFrames count their rows, tuples (main frame, extras...) count their
+    first item and lists (batch results) add up their items.
+    """
+    if hasattr(value, 'shape'):
+        return int(value.shape[0])
+    if isinstance(value, tuple) and value:
+        return count_rows(value[0])
+    if isinstance(value, list):
+        counts = [count_rows(getattr(item, 'df', item)) for item in value]
+        counts = [count for count in counts if count is not None]
+        return sum(counts) if counts else None
+    return None
+
+
+class StageTimer:
+    
+    def __init__(self, keep_spans: bool = True, **context: Any) -> None:
+        """
+        Args:
+            keep_spans: Keep finished spans in `self.spans` (disable for long-lived timers)
+            **context: Fields added to every logged span (page name...)
+        """
+        self.keep_spans = keep_spans
+        self.context = context
+        self.spans: list[dict[str, Any]] = []
+    
+    @contextmanager
+    def span(self, stage: str, **fields: Any) -> Iterator[dict[str, Any]]:
+        """Time a block; fields set on the yielded dict are recorded with the span.
+        
+        Args:
+            stage: Stage name
+            **fields: Initial fields (rows, input_bytes, cached...)
+        
+        Yields:
+            Mutable span record
+        """
+        record: dict[str, Any] = {'stage': stage, **fields}
+        start = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record['error'] = str(e)
+            raise
+        finally:
+            record['seconds'] = round(time.perf_counter() - start, 6)
+            if self.keep_spans:
+                self.spans.append(record)
+            # Attributed to the `with` statement: this generator <- contextlib __exit__ <- caller
+            app_logs.info(f"{stage}: {record['seconds']:.3f} s", stacklevel=3, event='stage', **self.context, **record)
+    
+    def total_seconds(self) -> float:
+        return sum(span['seconds'] for span in self.spans)
@@ -0,0 +1,27 @@
+"""
+Process pools safe to start from the multi-threaded Streamlit server.
+
+The default start method on Linux is fork, which copies the parent with
+whatever locks its other threads (script runners, the app_logs listener)
+hold at that moment, and a child can deadlock on them. Pools here use
+spawn: workers start a fresh interpreter and import only what they run.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+POOL_CONTEXT = multiprocessing.get_context('spawn')
+
+
+def process_pool(max_workers: int, **kwargs: Any) -> ProcessPoolExecutor:
+    """Create a ProcessPoolExecutor whose workers are spawned, not forked.
+    
+    Args:
+        max_workers: Worker processes
+        **kwargs: Other ProcessPoolExecutor options (initializer, initargs...)
+    
+    Returns:
+        Executor, to use as a context manager
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=POOL_CONTEXT, **kwargs)
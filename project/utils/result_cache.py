@@ -0,0 +1,236 @@
+"""
+Process-wide, zero-copy cache of pipeline results.
+
+Results are shared by every session of the server process: a DataFrame is
+frozen once when stored (its NumPy columns become read-only, without
+copying them) and each hit returns a shallow view of it, so sessions can add
+or replace columns on their view but never write into the shared data.
+Arrow tables are immutable and are returned as they are.
+
+Entries are keyed by the upstream file hash plus the operation and its
+parameters, and the least recently used ones are evicted when the cache
+exceeds its byte budget. Concurrent requests for the same missing key
+compute it once.
+"""
+
+import os
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_MAX_BYTES = int(os.environ.get("SMARTTOOLS_RESULT_CACHE_MAX_BYTES", 512 * 1024 ** 2))
+
+
+class CacheStats(NamedTuple):
+    entries: int
+    bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+def estimate_nbytes(value: Any) -> int:
+    """Memory held by a cached value (DataFrames, arrays, Arrow tables and tuples/lists of them)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True, index=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True, index=True))
+    if hasattr(value, 'nbytes'):
+        return int(value.nbytes)
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(item) for item in value) + sys.getsizeof(value)
+    return sys.getsizeof(value)
+
+
+def freeze_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return a frame sharing the data of `df` whose NumPy columns are read-only.
+    
+    No data is copied. Extension columns (categorical, nullable, Arrow) are
+    shared as they are.
+    """
+    columns = {}
+    for position in range(df.shape[1]):
+        values = df.iloc[:, position].array
+        if isinstance(values.dtype, np.dtype):
+            values = values.to_numpy()
+            values.flags.writeable = False
+        columns[position] = values
+    frozen = pd.DataFrame(columns, index=df.index, copy=False)
+    frozen.columns = df.columns
+    frozen.attrs = dict(df.attrs)
+    return frozen
+
+
+def _map_frames(value: Any, function: Callable[[pd.DataFrame], pd.DataFrame]) -> Any:
+    """Apply `function` to the DataFrames of a value, inside tuples, named tuples, lists and dicts."""
+    if isinstance(value, pd.DataFrame):
+        return function(value)
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+        return value
+    if isinstance(value, tuple):
+        items = [_map_frames(item, function) for item in value]
+        return type(value)(*items) if hasattr(value, '_fields') else tuple(items)
+    if isinstance(value, list):
+        return [_map_frames(item, function) for item in value]
+    if isinstance(value, dict):
+        return {key: _map_frames(item, function) for key, item in value.items()}
+    return value
+
+
+def _view(df: pd.DataFrame) -> pd.DataFrame:
+    return df.copy(deep=False)
+
+
+class ResultCache:
+    
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+    
+    @staticmethod
+    def make_key(file_hash: str, operation: str, *params: Hashable) -> tuple:
+        """Build the key of an operation applied to an uploaded file.
+        
+        Args:
+            file_hash: Hash of the source file content
+            operation: Operation name (e.g. 'BDV Consolidado Reader:status')
+            *params: Every parameter the result depends on
+        
+        Returns:
+            Hashable cache key
+        """
+        return (file_hash, operation, *params)
+    
+    def get(self, key: Hashable) -> Any | None:
+        """Return a read-only view of a cached value and mark it as recently used.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value, or None on a miss
+        """
+        return self._get(key, count_miss=True)
+    
+    def _get(self, key: Hashable, count_miss: bool) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += count_miss
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+        return _map_frames(entry[0], _view)
+    
+    def put(self, key: Hashable, value: Any) -> Any:
+        """Store a value (frames are frozen in place) and evict old entries over the budget.
+        
+        Values larger than the whole budget are returned without being stored.
+        
+        Args:
+            key: Cache key
+            value: Result to share (must not be mutated afterwards)
+        
+        Returns:
+            A read-only view of the stored value
+        """
+        frozen = _map_frames(value, freeze_frame)
+        nbytes = estimate_nbytes(frozen)
+        if nbytes > self.max_bytes:
+            return _map_frames(frozen, _view)
+        
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (frozen, nbytes)
+            self._bytes += nbytes
+            self._evict()
+        return _map_frames(frozen, _view)
+    
+    def get_or_compute(self, key: Hashable, compute: Callable[[], Any]) -> tuple[Any, bool]:
+        """Return the cached value, computing and storing it on a miss.
+        
+        Sessions asking for the same missing key wait for the first one
+        instead of computing it again. None results are not cached.
+        
+        Args:
+            key: Cache key
+            compute: Function producing the value
+        
+        Returns:
+            Tuple (value, whether it came from the cache)
+        """
+        value = self.get(key)
+        if value is not None:
+            return value, True
+        
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        try:
+            with key_lock:
+                # Another session may have stored it while this one waited
+                value = self._get(key, count_miss=False)
+                if value is not None:
+                    return value, True
+                value = compute()
+                if value is None:
+                    return None, False
+                return self.put(key, value), False
+        finally:
+            with self._lock:
+                self._key_locks.pop(key, None)
+    
+    def _evict(self) -> None:
+        # Called with the lock held
+        while self._bytes > self.max_bytes and self._entries:
+            _, (_, nbytes) = self._entries.popitem(last=False)
+            self._bytes -= nbytes
+            self._evictions += 1
+    
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(len(self._entries), self._bytes, self.max_bytes, self._hits, self._misses, self._evictions)
+    
+    def discard(self, predicate: Callable[[Hashable], bool]) -> int:
+        """Remove the entries whose key matches `predicate`.
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            keys = [key for key in self._entries if predicate(key)]
+            for key in keys:
+                self._bytes -= self._entries.pop(key)[1]
+        return len(keys)
+    
+    def clear(self) -> None:
+        """Remove every entry (views already handed out stay valid)."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+_default_cache: ResultCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Return the process-wide cache configured by SMARTTOOLS_RESULT_CACHE_MAX_BYTES."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            _default_cache = ResultCache()
+    return _default_cache
@@ -3,13 +3,24 @@ Streamlit cache utilities for reusable cached functions.
 
 This module provides cached functions that can be shared across different pages
 and components to improve performance and avoid redundant processing.
+
+The DataFrame helpers are keyed by lineage (`project/utils/lineage.py`):
+frames produced by the page stages know which file and operations they come
+from, so a lookup never hashes the frame itself. Their results live in the
+shared result cache as read-only views. Frames without lineage are simply
+processed, uncached.
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 from io import BytesIO
 from typing import Optional, Any, Callable
-import hashlib
+from project.utils.hashing import get_file_hash
+from project.utils.export import write_frame
+from project.utils.memory import estimate_text_memory
+from project.utils.lineage import cached_by_lineage
+from project.utils.result_cache import get_result_cache
 
 
 @st.cache_data(show_spinner="📖 Reading Excel file...")
@@ -34,12 +45,14 @@ def read_excel_cached(file_bytes: bytes, file_name: str, header: int = 0,
         return None
 
 
-@st.cache_data(show_spinner="📊 Processing data...")
+@cached_by_lineage(ignore=('process_func',))
 def process_dataframe_cached(df: pd.DataFrame, 
                             process_func: Callable[[pd.DataFrame], pd.DataFrame],
                             cache_key: str) -> pd.DataFrame:
     """Process DataFrame with caching using a custom processing function.
     
+    The function itself is not part of the key: `cache_key` names it.
+    
     Args:
         df: Input DataFrame
         process_func: Function to process the DataFrame
@@ -63,9 +76,7 @@ def convert_df_to_excel(df: pd.DataFrame, sheet_name: str = "Sheet1") -> bytes:
         Excel file as bytes
     """
     buffer = BytesIO()
-    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-        df.to_excel(writer, index=False, sheet_name=sheet_name)
-    buffer.seek(0)
+    write_frame(df, buffer, 'xlsx', sheet_name=sheet_name)
     return buffer.getvalue()
 
 
@@ -84,9 +95,12 @@ def convert_df_to_csv(df: pd.DataFrame, sep: str = ',', encoding: str = 'utf-8')
     return df.to_csv(index=False, sep=sep, encoding=encoding).encode(encoding)
 
 
-@st.cache_data(ttl=3600)
+@cached_by_lineage()
 def compute_dataframe_stats(df: pd.DataFrame) -> dict[str, Any]:
-    """Compute basic statistics from DataFrame with 1-hour cache.
+    """Compute basic statistics from DataFrame with caching.
+    
+    `memory_saved` compares the actual memory with the same data held as
+    Python strings (the readers' `dtype=str` default).
     
     Args:
         df: Input DataFrame
@@ -94,16 +108,20 @@ def compute_dataframe_stats(df: pd.DataFrame) -> dict[str, Any]:
     Returns:
         Dictionary with statistics
     """
+    memory_usage = int(df.memory_usage(deep=True, index=False).sum())
+    memory_as_text = estimate_text_memory(df)
     return {
         'rows': len(df),
         'columns': len(df.columns),
-        'memory_usage': df.memory_usage(deep=True).sum(),
+        'memory_usage': memory_usage,
+        'memory_as_text': memory_as_text,
+        'memory_saved': max(memory_as_text - memory_usage, 0),
         'dtypes': df.dtypes.to_dict(),
         'null_counts': df.isnull().sum().to_dict()
     }
 
 
-@st.cache_data
+@cached_by_lineage()
 def filter_dataframe_cached(df: pd.DataFrame, 
                            column: str, 
                            values: list[Any]) -> pd.DataFrame:
@@ -117,10 +135,10 @@ def filter_dataframe_cached(df: pd.DataFrame,
     Returns:
         Filtered DataFrame
     """
-    return df[df[column].isin(values)].copy()
+    return df[df[column].isin(values)]
 
 
-@st.cache_data
+@cached_by_lineage()
 def group_and_aggregate_cached(df: pd.DataFrame,
                                group_by: list[str],
                                agg_dict: dict[str, str | list[str]]) -> pd.DataFrame:
@@ -137,7 +155,7 @@ def group_and_aggregate_cached(df: pd.DataFrame,
     return df.groupby(group_by).agg(agg_dict).reset_index()
 
 
-@st.cache_data
+@cached_by_lineage()
 def merge_dataframes_cached(df1: pd.DataFrame,
                            df2: pd.DataFrame,
                            on: str | list[str],
@@ -156,9 +174,9 @@ def merge_dataframes_cached(df1: pd.DataFrame,
     return pd.merge(df1, df2, on=on, how=how)
 
 
-@st.cache_data(ttl=600)
+@cached_by_lineage()
 def get_unique_values_cached(df: pd.DataFrame, column: str) -> list[Any]:
-    """Get unique values from a column with 10-minute cache.
+    """Get unique values from a column with caching.
     
     Args:
         df: Input DataFrame
@@ -174,21 +192,29 @@ def get_unique_values_cached(df: pd.DataFrame, column: str) -> list[Any]:
         return unique_vals
 
 
-def get_file_hash(file_bytes: bytes) -> str:
-    """Generate hash for file content to use as cache key.
+@cached_by_lineage()
+def get_sort_order_cached(df: pd.DataFrame, column: str, ascending: bool = True) -> np.ndarray:
+    """Get the row positions that sort a DataFrame by one column, with caching.
+    
+    Only the order is cached (not a sorted copy), so a page can be taken
+    with `df.iloc[order[start:stop]]`. Missing values go last.
     
     Args:
-        file_bytes: File content as bytes
+        df: Input DataFrame
+        column: Column name
+        ascending: Sort direction
         
     Returns:
-        SHA256 hash string
+        Array of row positions
     """
-    return hashlib.sha256(file_bytes).hexdigest()
+    values = df[column].reset_index(drop=True)
+    return values.sort_values(ascending=ascending, kind='stable', na_position='last').index.to_numpy()
 
 
 def clear_all_cache() -> None:
-    """Clear all Streamlit cache_data caches."""
+    """Clear all Streamlit cache_data caches and the shared result cache."""
     st.cache_data.clear()
+    get_result_cache().clear()
     st.success("✅ All caches cleared!")
 
 
@@ -0,0 +1,58 @@
+"""
+Download buttons that build export files lazily.
+
+The export callable only runs when the user clicks a button (on a separate
+thread, without rerunning the page), so reruns never pay for building files
+that nobody downloads.
+"""
+
+from typing import Callable
+
+import streamlit as st
+import pandas as pd
+
+from project.utils.export import EXPORT_FORMATS, EXCEL_MAX_ROWS, MIME_TYPES, export_bytes
+
+FORMAT_LABELS = {
+    'xlsx': "Excel",
+    'csv': "CSV",
+    'parquet': "Parquet",
+}
+
+
+def _deferred_export(df: pd.DataFrame, fmt: str, sheet_name: str) -> Callable[[], bytes]:
+    return lambda: export_bytes(df, fmt, sheet_name=sheet_name)
+
+
+def render_download_buttons(df: pd.DataFrame,
+                            label: str,
+                            file_stem: str,
+                            key: str,
+                            sheet_name: str = "Sheet1",
+                            formats: list[str] | None = None) -> None:
+    """Render one download button per export format, side by side.
+    
+    Args:
+        df: Result to export (must not be mutated afterwards)
+        label: Button label, the format name is appended
+        file_stem: File name without extension
+        key: Widget key of the Excel button; other formats get a suffix
+        sheet_name: Sheet name for the Excel file
+        formats: Formats to offer (default: xlsx, csv and parquet)
+    """
+    formats = formats or EXPORT_FORMATS
+    columns = st.columns(len(formats))
+    
+    for column, fmt in zip(columns, formats):
+        with column:
+            too_big = fmt == 'xlsx' and len(df) + 1 > EXCEL_MAX_ROWS
+            st.download_button(
+                label=f"{label} ({FORMAT_LABELS.get(fmt, fmt)})",
+                data=_deferred_export(df, fmt, sheet_name),
+                file_name=f"{file_stem}.{fmt}",
+                mime=MIME_TYPES[fmt],
+                key=key if fmt == 'xlsx' else f"{key}_{fmt}",
+                on_click="ignore",
+                disabled=too_big,
+                help="Too many rows for Excel, use CSV or Parquet." if too_big else None
+            )
@@ -0,0 +1,99 @@
+"""
+Paginated result grid.
+
+Only the visible page is sent to the browser. Filtering and sorting run on
+the server through the cached helpers, so paging through a large report
+only slices an already filtered and sorted result.
+"""
+
+import math
+from typing import Any
+
+import streamlit as st
+import pandas as pd
+
+from project.utils.streamlit.cache_data_utils import filter_dataframe_cached, get_unique_values_cached, get_sort_order_cached
+
+PAGE_SIZES = [50, 100, 500, 1000]
+
+# Columns with more distinct values than this are not offered as filters
+MAX_FILTER_VALUES = 1000
+
+
+def _default_filter_columns(df: pd.DataFrame) -> list[str]:
+    return [
+        column for column in df.columns
+        if isinstance(df[column].dtype, pd.CategoricalDtype) or df[column].dtype == object
+    ]
+
+
+def render_paginated_grid(df: pd.DataFrame,
+                          key: str,
+                          column_config: dict[str, Any] | None = None,
+                          filter_columns: list[str] | None = None,
+                          page_size: int = 100) -> None:
+    """Render a filterable, sortable table that only ships the current page.
+    
+    Args:
+        df: Data to show (must not be mutated afterwards, it is used as cache key)
+        key: Prefix for the widget keys
+        column_config: Column formatting passed to `st.dataframe`
+        filter_columns: Columns offered in the filter (default: text and categorical columns)
+        page_size: Initial rows per page
+    """
+    filter_columns = _default_filter_columns(df) if filter_columns is None else filter_columns
+    view = df
+    
+    col_filter, col_values, col_sort, col_order = st.columns([2, 3, 2, 1])
+    with col_filter:
+        filter_column = st.selectbox(
+            "🔎 Filter by",
+            [None] + filter_columns,
+            format_func=lambda column: "—" if column is None else column,
+            key=f"{key}_filter_column"
+        )
+    with col_values:
+        if filter_column is not None:
+            options = get_unique_values_cached(df, filter_column)
+            if len(options) > MAX_FILTER_VALUES:
+                st.caption(f"Too many distinct values to filter ({len(options):,}).")
+            else:
+                values = st.multiselect("Values", options, key=f"{key}_filter_values_{filter_column}")
+                if values:
+                    view = filter_dataframe_cached(df, filter_column, values)
+    with col_sort:
+        sort_column = st.selectbox(
+            "↕️ Sort by",
+            [None] + list(df.columns),
+            format_func=lambda column: "—" if column is None else column,
+            key=f"{key}_sort_column"
+        )
+    with col_order:
+        descending = st.toggle("Desc.", key=f"{key}_sort_descending", disabled=sort_column is None)
+    
+    total = len(view)
+    
+    col_page, col_size, col_info = st.columns([1, 1, 3])
+    with col_size:
+        size = st.selectbox("Rows per page", PAGE_SIZES, index=PAGE_SIZES.index(page_size) if page_size in PAGE_SIZES else 1, key=f"{key}_page_size")
+    
+    pages = max(1, math.ceil(total / size))
+    page_key = f"{key}_page"
+    # A narrower filter can leave the stored page out of range
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    with col_page:
+        page = st.number_input("Page", min_value=1, max_value=pages, step=1, key=page_key)
+    
+    start = (page - 1) * size
+    stop = min(start + size, total)
+    with col_info:
+        st.caption(f"Rows {start + 1 if total else 0:,}–{stop:,} of {total:,}" + (f" (filtered from {len(df):,})" if total != len(df) else ""))
+    
+    if sort_column is None:
+        page_df = view.iloc[start:stop]
+    else:
+        order = get_sort_order_cached(view, sort_column, ascending=not descending)
+        page_df = view.iloc[order[start:stop]]
+    
+    st.dataframe(page_df, width='stretch', hide_index=True, column_config=column_config)
@@ -0,0 +1,43 @@
+import pandas as pd
+
+from project.processors.km_state import KmStateStore
+
+
+def _month(month: int, km: float) -> pd.DataFrame:
+    """Three continuous readings of vehicle ABC1D23 in a month, starting at `km`."""
+    return pd.DataFrame({
+        'Veículo': ['ABC1D23'] * 3,
+        'Data': [f"{day:02d}/{month:02d}/2025" for day in (1, 15, 28)],
+        'Km Inicial': [km, km + 100, km + 200],
+        'Km Final': [km + 100, km + 200, km + 300],
+    })
+
+
+def test_out_of_order_upload_keeps_latest_state(tmp_path):
+    store = KmStateStore(tmp_path / "km_state.parquet")
+    
+    found, updated = store.check_and_update(_month(1, 0), "jan")
+    assert updated and found.empty
+    found, _ = store.check_and_update(_month(3, 600), "mar")
+    assert not found.empty  # February is still missing: 300 -> 600
+    
+    # February arrives late: it must not be checked against the newer March state
+    found, updated = store.check_and_update(_month(2, 300), "feb")
+    assert updated and found.empty
+    
+    last_records, applied_files = store.load()
+    assert last_records.loc[0, 'Data'] == "28/03/2025"
+    assert last_records.loc[0, 'Km Final'] == 900
+    assert applied_files == ["jan", "mar", "feb"]
+    
+    # The next month is checked against March, not against the late February
+    found, _ = store.check_and_update(_month(4, 900), "apr")
+    assert found.empty
+
+
+def test_rows_are_checked_in_date_order(tmp_path):
+    store = KmStateStore(tmp_path / "km_state.parquet")
+    
+    found, _ = store.check_and_update(_month(1, 0).iloc[::-1], "jan")
+    assert found.empty
+    assert store.load()[0].loc[0, 'Data'] == "28/01/2025"